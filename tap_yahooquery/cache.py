@@ -0,0 +1,158 @@
+"""On-disk cache for Yahoo responses, with TTLs matched to each endpoint's update cadence."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from datetime import timedelta
+
+DEFAULT_CACHE_DIR = "~/.tap-yahooquery/cache"
+
+# Fundamentals change quarterly at best, news within the hour
+ENDPOINT_TTLS = {
+    "sec_filings": timedelta(days=90),
+    "income_statement": timedelta(days=90),
+    "all_financial_data": timedelta(days=90),
+    "earning_history": timedelta(days=30),
+    "company_officers": timedelta(days=30),
+    "dividend_history": timedelta(days=7),
+    "corporate_events": timedelta(days=7),
+    "corporate_guidance": timedelta(days=7),
+    "earnings": timedelta(days=1),
+    "earnings_trend": timedelta(days=1),
+    "calendar_events": timedelta(days=1),
+    "news": timedelta(hours=1),
+    # several quoteSummary modules fetched together; as fresh as the shortest of them
+    "quote_summary_modules": timedelta(days=1),
+}
+DEFAULT_TTL = timedelta(days=1)
+
+
+class FileCache:
+    """
+    Pickled responses under {cache_dir}/{endpoint}/{md5(key)}.pkl, each with a sidecar
+    .meta.json holding fetched_at and ttl_seconds.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = os.path.expanduser(cache_dir)
+
+    def _paths(self, endpoint: str, key: str) -> tuple[str, str]:
+        base = os.path.join(
+            self.cache_dir, endpoint, hashlib.md5(key.encode()).hexdigest()
+        )
+        return f"{base}.pkl", f"{base}.meta.json"
+
+    def get(self, endpoint: str, key: str, ttl_seconds: float):
+        """Return the cached value, or None when missing, unreadable or older than ttl_seconds."""
+        data_path, meta_path = self._paths(endpoint, key)
+        try:
+            with open(meta_path) as f:
+                fetched_at = json.load(f)["fetched_at"]
+            if time.time() - fetched_at >= ttl_seconds:
+                return None
+            with open(data_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, ValueError, KeyError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def set(self, endpoint: str, key: str, value, ttl_seconds: float) -> None:
+        data_path, meta_path = self._paths(endpoint, key)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+        # Data first, then meta, so a reader never sees fresh meta with stale data
+        with open(data_path + suffix, "wb") as f:
+            pickle.dump(value, f)
+        os.replace(data_path + suffix, data_path)
+        with open(meta_path + suffix, "w") as f:
+            json.dump({"fetched_at": time.time(), "ttl_seconds": ttl_seconds}, f)
+        os.replace(meta_path + suffix, meta_path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_file_cache(cache_dir: str) -> FileCache:
+    return FileCache(cache_dir)
+
+
+def resolve_ttl_seconds(config: dict, stream_config: dict, endpoint: str):
+    """
+    TTL for endpoint, or None when caching is off. A stream's cache_ttl wins over the
+    global cache_ttl_seconds, which wins over the endpoint default used by cache_enabled.
+    """
+    if stream_config.get("cache_ttl") is not None:
+        return stream_config["cache_ttl"]
+    if config.get("cache_ttl_seconds"):
+        return config["cache_ttl_seconds"]
+    if config.get("cache_enabled", False):
+        return ENDPOINT_TTLS.get(endpoint, DEFAULT_TTL).total_seconds()
+    return None
+
+
+def stream_cache(stream, endpoint: str):
+    """(FileCache, ttl_seconds) for stream's endpoint, or (None, None) when caching is off."""
+    ttl_seconds = resolve_ttl_seconds(
+        stream.config, stream._get_stream_config(), endpoint
+    )
+    if not ttl_seconds:
+        return None, None
+    return (
+        get_file_cache(stream.config.get("cache_dir") or DEFAULT_CACHE_DIR),
+        ttl_seconds,
+    )
+
+
+def cache_key(ticker: str, method_name: str, *args, **kwargs) -> str:
+    return repr((ticker, method_name, args, sorted(kwargs.items())))
+
+
+def is_cacheable(value) -> bool:
+    """False for empty, invalid-crumb and per-symbol error responses."""
+    if value is None or len(value) == 0:
+        return False
+    if isinstance(value, dict) and "Invalid Crumb" in str(value):
+        return False
+    # yahooquery reports per-symbol failures ("Quote not found...", "No fundamentals
+    # data found...") as message strings; retry those next run
+    return not (
+        isinstance(value, dict) and any(isinstance(v, str) for v in value.values())
+    )
+
+
+def cached(func):
+    """
+    Serve (ticker, endpoint, kwargs) responses from the FileCache while they are within TTL.
+    The endpoint, which picks the cache bucket and default TTL, is method_name unless an
+    explicit endpoint= is passed, e.g. for generic methods such as get_modules.
+    Empty, invalid-crumb and per-symbol error responses are not stored.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, ticker, method_name, *args, endpoint=None, **kwargs):
+        endpoint = endpoint or method_name
+        cache, ttl_seconds = stream_cache(self, endpoint)
+        if cache is None:
+            return func(self, ticker, method_name, *args, **kwargs)
+
+        key = cache_key(ticker, method_name, *args, **kwargs)
+        value = cache.get(endpoint, key, ttl_seconds)
+        if value is not None:
+            return value
+
+        value = func(self, ticker, method_name, *args, **kwargs)
+        if not is_cacheable(value):
+            return value
+
+        try:
+            cache.set(endpoint, key, value, ttl_seconds)
+        except OSError as e:
+            logging.warning(f"Could not cache {endpoint} for {ticker}: {e}")
+        return value
+
+    return wrapper
@@ -3,16 +3,51 @@
 from __future__ import annotations
 
 from abc import ABC
+from concurrent.futures import Future
+import functools
+import threading
 import time
 import pandas as pd
 from singer_sdk.helpers.types import Context
-from tap_yahooquery.helpers import TickerFetcher, yahoo_api_retry
+from tap_yahooquery.cache import cache_key, cached, is_cacheable, stream_cache
+from tap_yahooquery.helpers import (
+    TickerFetcher,
+    yahoo_api_retry,
+    async_fetch_many,
+    QUOTE_SUMMARY_MODULES,
+)
 from typing import Union
 from singer_sdk.streams import Stream
 from singer_sdk import Tap
 import logging
 
-import yahooquery as yq
+# Yahoo rejects or truncates multi-symbol requests beyond this many symbols
+MAX_FETCH_BATCH_SIZE = 99
+
+# Endpoints yahooquery builds with _to_dataframe -> (quoteSummary module, data filter).
+# _to_dataframe labels frames by batch position and skips symbols that errored, so one
+# bad symbol shifts its neighbours' rows; batches fetch the raw module instead.
+BATCH_MODULE_FRAMES = {
+    "sec_filings": ("secFilings", "filings"),
+    "company_officers": ("assetProfile", "companyOfficers"),
+    "earning_history": ("earningsHistory", "history"),
+}
+
+# Methods answering {symbol: data or error message} rather than a DataFrame
+DICT_METHODS = {*QUOTE_SUMMARY_MODULES, "get_modules"}
+
+
+class lazy_schema:
+    """Build a stream's schema dict on first access and cache it on the class."""
+
+    def __init__(self, builder) -> None:
+        self.builder = builder
+        self.schema = None
+
+    def __get__(self, obj, owner=None) -> dict:
+        if self.schema is None:
+            self.schema = self.builder()
+        return self.schema
 
 
 class YahooQueryStream(Stream, ABC):
@@ -20,10 +55,23 @@ class YahooQueryStream(Stream, ABC):
 
     _use_cached_tickers_default = True
     _valid_segments = None
+    # quoteSummary module this stream reads, for combine_quote_summary_modules
+    _quote_summary_module = None
 
     def __init__(self, tap: Tap) -> None:
         super().__init__(tap)
         self._all_tickers = None
+        self._partition_tickers = None
+        self._async_prefetched = {}
+        self._async_prefetch_lock = threading.Lock()
+        # (method_name, kwargs) -> {symbol: future of its batch's per-symbol results}
+        self._batches: dict[tuple, dict[str, Future]] = {}
+        self._batch_lock = threading.Lock()
+
+    @functools.cached_property
+    def expected_columns(self) -> list[str]:
+        """Schema property names, used for the empty frame of a ticker with no data."""
+        return list(self.schema["properties"])
 
     def _get_stream_config(self) -> dict:
         """Get configuration for this specific stream."""
@@ -76,6 +124,7 @@ class YahooQueryStream(Stream, ABC):
         )
 
         partitions = [{"ticker": ticker["ticker"]} for ticker in filtered_tickers]
+        self._partition_tickers = [p["ticker"] for p in partitions]
 
         self.logger.info(f"Created {len(partitions)} ticker partitions for {self.name}")
         return partitions
@@ -144,12 +193,268 @@ class YahooQueryStream(Stream, ABC):
 
         return ticker
 
+    def _finish_partition(self, ticker: str) -> None:
+        """Release per-sync state once the last partition ticker has been fetched."""
+        if self._partition_tickers and ticker == self._partition_tickers[-1]:
+            self._release_sync_state()
+
+    def _release_sync_state(self) -> None:
+        """Drop resources held across partitions; runs after the stream's last partition."""
+        if self._quote_summary_module:
+            self._tap.drop_combined_modules(self)
+
+    def _fetch_data(
+        self,
+        ticker: str,
+        method_name: str,
+        is_callable: bool = True,
+        endpoint: Union[str, None] = None,
+        **kwargs,
+    ) -> Union[dict, pd.DataFrame]:
+        """
+        Return data for a ticker, served from the async prefetch when enabled.
+        endpoint names the response for caching when method_name is generic (get_modules).
+        """
+        if (
+            self.config.get("async_fetch", False)
+            and method_name in QUOTE_SUMMARY_MODULES
+            and self._partition_tickers
+        ):
+            prefetched = self._get_async_prefetched(method_name, is_callable, **kwargs)
+            if ticker in prefetched:
+                # shaped like the yahooquery property for this one ticker
+                data = {ticker: prefetched.pop(ticker)}
+                if "Invalid Crumb" not in str(data):
+                    return data
+
+        if self._quote_summary_module and self.config.get(
+            "combine_quote_summary_modules", False
+        ):
+            data = self._tap.get_combined_module(self, ticker)
+            if data is not None:
+                return data
+
+        if self.config.get("fetch_batch_size", 1) > 1 and self._partition_tickers:
+            data = self._get_batched(
+                ticker, method_name, is_callable, endpoint=endpoint, **kwargs
+            )
+            if data is not None:
+                return data
+
+        return self._fetch_with_crumb_retry(
+            ticker, method_name, is_callable=is_callable, endpoint=endpoint, **kwargs
+        )
+
+    def _get_async_prefetched(
+        self, method_name: str, is_callable: bool = True, **kwargs
+    ) -> dict:
+        """
+        Fetch every partition ticker for method_name in one async fan-out. Tickers
+        with a fresh FileCache entry are left to the cached synchronous path, and the
+        fetched responses are cached under the keys that path reads.
+        """
+        with self._async_prefetch_lock:
+            if method_name not in self._async_prefetched:
+                cache, ttl_seconds = stream_cache(self, method_name)
+                keys = {
+                    ticker: cache_key(
+                        ticker, method_name, is_callable=is_callable, **kwargs
+                    )
+                    for ticker in self._partition_tickers or []
+                }
+                if cache is not None:
+                    keys = {
+                        ticker: key
+                        for ticker, key in keys.items()
+                        if cache.get(method_name, key, ttl_seconds) is None
+                    }
+                tickers = list(keys)
+                self.logger.info(
+                    f"{self.name}: Async prefetching {method_name} for {len(tickers)} tickers"
+                )
+                try:
+                    self._async_prefetched[method_name] = async_fetch_many(
+                        tickers,
+                        method_name,
+                        concurrency=self.config.get("async_concurrency", 50),
+                        max_tries=self.config.get("async_max_tries", 5),
+                        handshake=(
+                            self._tap.get_ticker_obj(tickers[0]) if tickers else None
+                        ),
+                    )
+                except Exception as e:
+                    self.logger.warning(
+                        f"{self.name}: Async prefetch failed, falling back to sync: {e}"
+                    )
+                    self._async_prefetched[method_name] = {}
+
+                if cache is not None:
+                    for ticker, data in self._async_prefetched[method_name].items():
+                        value = {ticker: data}
+                        if is_cacheable(value):
+                            try:
+                                cache.set(method_name, keys[ticker], value, ttl_seconds)
+                            except OSError as e:
+                                self.logger.warning(
+                                    f"Could not cache {method_name} for {ticker}: {e}"
+                                )
+            return self._async_prefetched[method_name]
+
+    def _get_batched(
+        self,
+        ticker: str,
+        method_name: str,
+        is_callable: bool = True,
+        endpoint: Union[str, None] = None,
+        **kwargs,
+    ) -> Union[dict, pd.DataFrame, None]:
+        """
+        Fetch ticker together with the next fetch_batch_size partition tickers through
+        one multi-symbol yahooquery Ticker, then hand each ticker its own slice.
+        Returns None when the batch had nothing for ticker, so the caller can fetch it alone.
+        """
+        key = (method_name, tuple(sorted(kwargs.items())))
+        batch = None
+        with self._batch_lock:
+            batches = self._batches.setdefault(key, {})
+            if ticker not in batches and ticker in self._partition_tickers:
+                position = self._partition_tickers.index(ticker)
+                batch = [
+                    symbol
+                    for symbol in self._partition_tickers[position:]
+                    if symbol not in batches
+                ][: min(self.config.get("fetch_batch_size", 1), MAX_FETCH_BATCH_SIZE)]
+                batches.update(dict.fromkeys(batch, Future()))
+            future = batches.get(ticker)
+        if future is None:
+            return None
+
+        # The lock is released for the request; tickers of this batch wait on its future
+        if batch is not None:
+            try:
+                future.set_result(
+                    self._fetch_batch(
+                        batch, method_name, is_callable, endpoint, **kwargs
+                    )
+                )
+            except Exception as e:
+                future.set_exception(e)
+                raise
+
+        try:
+            results = future.result()
+        except Exception:
+            return None
+        with self._batch_lock:
+            return results.pop(ticker, None)
+
+    def _fetch_batch(
+        self,
+        batch: list[str],
+        method_name: str,
+        is_callable: bool = True,
+        endpoint: Union[str, None] = None,
+        **kwargs,
+    ) -> dict[str, Union[dict, pd.DataFrame]]:
+        """Fetch batch through one multi-symbol request and split it per symbol."""
+        self.logger.info(
+            f"{self.name}: Fetching {method_name} for {len(batch)} tickers in one batch"
+        )
+        if method_name in BATCH_MODULE_FRAMES:
+            module, data_filter = BATCH_MODULE_FRAMES[method_name]
+            data = self._fetch_with_crumb_retry(
+                " ".join(batch),
+                "get_modules",
+                asynchronous=len(batch) > 1,
+                endpoint=method_name,
+                modules=module,
+            )
+            return self._split_module_frames(data, batch, data_filter)
+
+        data = self._fetch_with_crumb_retry(
+            " ".join(batch),
+            method_name,
+            is_callable=is_callable,
+            asynchronous=len(batch) > 1,
+            endpoint=endpoint,
+            **kwargs,
+        )
+        return self._split_by_symbol(
+            data, batch, expect_frame=method_name not in DICT_METHODS
+        )
+
+    @staticmethod
+    def _split_module_frames(
+        data: dict, symbols: list[str], data_filter: str
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Build each symbol's frame from its own entry of a multi-symbol get_modules
+        response, shaped like yahooquery's single-symbol _to_dataframe output.
+        Symbols that errored or lack data_filter are left out.
+        """
+        if not isinstance(data, dict):
+            return {}
+
+        frames = {}
+        for symbol in symbols:
+            entry = data.get(symbol)
+            if isinstance(entry, dict) and data_filter in entry:
+                frames[symbol] = pd.concat(
+                    [pd.DataFrame(entry[data_filter])],
+                    keys=[symbol],
+                    names=["symbol", "row"],
+                    sort=False,
+                )
+        return frames
+
+    @staticmethod
+    def _split_by_symbol(
+        data: Union[dict, pd.DataFrame], symbols: list[str], expect_frame: bool = True
+    ) -> dict[str, Union[dict, pd.DataFrame]]:
+        """
+        Split a multi-symbol yahooquery response into single-symbol responses.
+        Frames are split on the symbol index level, which these endpoints take from
+        the response itself.
+        """
+        if isinstance(data, pd.DataFrame):
+            if data.empty:
+                return {}
+            return {
+                symbol: frame
+                for symbol, frame in data.groupby(level=0, sort=False)
+                if symbol in symbols
+            }
+
+        if expect_frame:
+            # e.g. _financials returns the raw dict when any symbol errored; let every
+            # symbol fall back to its own request rather than emit raw payloads
+            return {}
+
+        if isinstance(data, dict):
+            return {
+                symbol: {symbol: data[symbol]}
+                for symbol in symbols
+                if symbol in data and "Invalid Crumb" not in str(data[symbol])
+            }
+
+        return {}
+
+    @cached
     @yahoo_api_retry
     def _fetch_with_crumb_retry(
-        self, ticker: str, method_name: str, is_callable: bool = True, **kwargs
+        self,
+        ticker: str,
+        method_name: str,
+        is_callable: bool = True,
+        asynchronous: bool = False,
+        **kwargs,
     ) -> Union[dict, pd.DataFrame]:
-        """Centralized Yahoo API call with crumb retry logic."""
-        ticker_obj = yq.Ticker(ticker)
+        """
+        Centralized Yahoo API call with crumb retry logic.
+        ticker may hold several space-separated symbols; asynchronous makes yahooquery
+        send their per-symbol requests concurrently.
+        """
+        ticker_obj = self._tap.get_ticker_obj(ticker, asynchronous=asynchronous)
         method = getattr(ticker_obj, method_name)
 
         if is_callable:
@@ -162,18 +467,11 @@ class YahooQueryStream(Stream, ABC):
 
         if isinstance(data, dict) and "Invalid Crumb" in str(data):
             self.logger.warning(f"Invalid crumb for {ticker}, retrying {method_name}")
-            ticker_obj.session.close()
-            ticker_obj._session = None
-            ticker_obj.crumb = None
-            ticker_obj.cookie = None
-            if hasattr(ticker_obj, "_session"):
-                ticker_obj._session = None
-            if hasattr(ticker_obj, "session"):
-                ticker_obj.session.close()
+            self._tap.reset_ticker_sessions()
 
             time.sleep(3)
 
-            ticker_obj = yq.Ticker(ticker)
+            ticker_obj = self._tap.get_ticker_obj(ticker, asynchronous=asynchronous)
             method = getattr(ticker_obj, method_name)
 
             if is_callable:
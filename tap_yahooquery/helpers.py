@@ -1,7 +1,10 @@
 import pandas as pd
 import numpy as np
 import re
+import random
+import sys
 import hashlib
+import asyncio
 from uuid import uuid4
 from datetime import datetime, timedelta
 from pytickersymbols import PyTickerSymbols
@@ -11,10 +14,22 @@ import logging
 import backoff
 import functools
 import time
+import yahooquery as yq
+from yahooquery.constants import MODULES_DICT
 
 from requests.exceptions import ConnectionError, RequestException
 from urllib3.exceptions import MaxRetryError, NewConnectionError
 
+try:
+    import aiohttp
+except ImportError:  # optional, installed with the `async` extra
+    aiohttp = None
+
+try:
+    import pyarrow
+except ImportError:  # optional, installed with the `arrow` extra
+    pyarrow = None
+
 pd.set_option("future.no_silent_downcasting", True)
 
 
@@ -68,9 +83,15 @@ def yahoo_api_retry(func):
         try:
             result = func(*args, **kwargs)
 
+            # An empty multi-symbol batch is not retried: its tickers fall back to
+            # their own requests, which retry individually
             if isinstance(result, pd.DataFrame) and result.empty:
-                if isinstance(ticker, str) and not any(
-                    x in str(ticker).lower() for x in ["none", "nan", "inf"]
+                if (
+                    isinstance(ticker, str)
+                    and " " not in ticker
+                    and not any(
+                        x in str(ticker).lower() for x in ["none", "nan", "inf"]
+                    )
                 ):
                     raise EmptyDataException(f"Empty data for {ticker} - retrying")
 
@@ -148,20 +169,146 @@ def yahoo_api_retry(func):
     return safe_wrapper
 
 
+QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}"
+
+# yahooquery properties that are a single quoteSummary module returned as a dict.
+QUOTE_SUMMARY_MODULES = {
+    "calendar_events": "calendarEvents",
+    "earnings": "earnings",
+    "earnings_trend": "earningsTrend",
+}
+
+
+async def _fetch_quote_summary(session, semaphore, ticker, params, max_tries):
+    """Fetch one ticker, retrying rate limits, 5xx and network errors with jittered backoff."""
+    for attempt in range(1, max_tries + 1):
+        try:
+            async with semaphore:
+                async with session.get(
+                    QUOTE_SUMMARY_URL.format(symbol=ticker), params=params
+                ) as response:
+                    if response.status == 429 or response.status >= 500:
+                        response.raise_for_status()
+                    return await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == max_tries:
+                raise
+            # Same full-jitter exponential backoff as yahoo_api_retry, slept outside the semaphore
+            wait = random.uniform(0, min(60, 3**attempt))
+            logging.info(
+                f"🔄 Retrying async request for {ticker} - "
+                f"attempt {attempt}/{max_tries}, waiting {wait:.1f}s: {e}"
+            )
+            await asyncio.sleep(wait)
+
+
+async def _gather_quote_summaries(
+    tickers, params, headers, cookies, concurrency, max_tries
+):
+    semaphore = asyncio.Semaphore(concurrency)
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(
+        headers=headers, cookies=cookies, timeout=timeout
+    ) as session:
+        return await asyncio.gather(
+            *[
+                _fetch_quote_summary(session, semaphore, ticker, params, max_tries)
+                for ticker in tickers
+            ],
+            return_exceptions=True,
+        )
+
+
+def async_fetch_many(tickers, endpoint, concurrency=50, max_tries=5, handshake=None):
+    """
+    Fetch a quoteSummary endpoint for many tickers concurrently on one event loop.
+
+    yahooquery is synchronous, so the bare quoteSummary endpoint is called directly with
+    aiohttp using the crumb, cookies and headers of handshake, a yq.Ticker whose session
+    already did the consent handshake (a fresh Ticker for tickers[0] when omitted).
+    aiohttp cannot replay the curl_cffi session's browser TLS impersonation, only its
+    headers. Returns a dict keyed by ticker, shaped exactly like the matching yahooquery
+    property. Each request is retried up to max_tries times; tickers that still failed
+    are left out so the caller can fall back to the synchronous path.
+    """
+    if aiohttp is None:
+        raise ImportError(
+            "async_fetch requires aiohttp. Install with: pip install 'tap-yahooquery[async]'"
+        )
+    if endpoint not in QUOTE_SUMMARY_MODULES:
+        raise ValueError(f"async_fetch_many does not support endpoint {endpoint}")
+    if not tickers:
+        return {}
+
+    module = QUOTE_SUMMARY_MODULES[endpoint]
+    owns_handshake = handshake is None
+    if owns_handshake:
+        handshake = yq.Ticker(tickers[0])
+    params = {
+        **handshake.default_query_params,
+        "modules": module,
+        "formatted": "false",
+    }
+    headers = dict(handshake.session.headers)
+    cookies = {cookie.name: cookie.value for cookie in handshake.session.cookies.jar}
+
+    try:
+        responses = asyncio.run(
+            _gather_quote_summaries(
+                tickers, params, headers, cookies, concurrency, max_tries
+            )
+        )
+    finally:
+        # a shared session stays open for the synchronous path
+        if owns_handshake:
+            handshake.session.close()
+
+    data = {}
+    for ticker, response in zip(tickers, responses):
+        if isinstance(response, Exception):
+            logging.warning(f"Async {endpoint} request failed for {ticker}: {response}")
+            continue
+        response = handshake._validate_response(response, "quoteSummary")
+        data[ticker] = handshake._construct_data(
+            response, "quoteSummary", addl_key=module
+        )
+    return handshake._format_data(data, MODULES_DICT[module]["convert_dates"])
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_string(s: str) -> str:
+    s = re.sub(r"[^a-zA-Z0-9_]", "_", s)  # remove special characters
+    s = re.sub(r"(?<!^)(?=[A-Z])", "_", s).lower()  # camel case -> snake case
+    # clean leading and trailing underscores
+    s = re.sub(r"_+", "_", s).strip("_").lower()
+    return sys.intern(s)
+
+
 def clean_strings(lst):
-    cleaned_list = [
-        re.sub(r"[^a-zA-Z0-9_]", "_", s) for s in lst
-    ]  # remove special characters
-    cleaned_list = [
-        re.sub(r"(?<!^)(?=[A-Z])", "_", s).lower() for s in cleaned_list
-    ]  # camel case -> snake case
-    cleaned_list = [
-        re.sub(r"_+", "_", s).strip("_").lower() for s in cleaned_list
-    ]  # clean leading and trailing underscores
-    return cleaned_list
-
-
-def fix_empty_values(df, exclude_columns=None, to_value=None):
+    # Column names repeat across tickers even when the full set differs, so memoize per name
+    return [_clean_string(s) for s in lst]
+
+
+_EMPTY_STRING_PATTERN = r"(?i)^(nan|none|infinity)$"
+
+
+def clean_empty_value(val, to_value=None):
+    """
+    fix_empty_values for a single value: np.nan, inf, -inf, None and the strings 'nan',
+    'none', 'infinity' become to_value, recursing into dicts and lists.
+    """
+    if isinstance(val, dict):
+        return {k: clean_empty_value(v, to_value) for k, v in val.items()}
+    if isinstance(val, list):
+        return [clean_empty_value(x, to_value) for x in val]
+    if isinstance(val, str) and re.match(_EMPTY_STRING_PATTERN, val):
+        return to_value
+    if val in [None, np.nan] or (isinstance(val, float) and not np.isfinite(val)):
+        return to_value
+    return val
+
+
+def fix_empty_values(df, exclude_columns=None, to_value=None, inplace=False):
     """
     Replaces np.nan, inf, -inf, None, and string versions of 'nan', 'none', 'infinity'
     recursively with a specified value (default None), except for columns listed in exclude_columns.
@@ -170,6 +317,7 @@ def fix_empty_values(df, exclude_columns=None, to_value=None):
         df (pd.DataFrame): The input DataFrame.
         exclude_columns (list, optional): Columns to skip. Defaults to None.
         to_value: What to replace missing values with (None or np.nan). Defaults to None.
+        inplace (bool, optional): Overwrite the columns of df instead of building a new frame.
 
     Returns:
         pd.DataFrame: Cleaned DataFrame.
@@ -179,18 +327,10 @@ def fix_empty_values(df, exclude_columns=None, to_value=None):
     if to_value is None:
         to_value = None
 
-    regex_pattern = r"(?i)^(nan|none|infinity)$"
+    regex_pattern = _EMPTY_STRING_PATTERN
 
     def clean_obj(val):
-        if isinstance(val, dict):
-            return {k: clean_obj(v) for k, v in val.items()}
-        if isinstance(val, list):
-            return [clean_obj(x) for x in val]
-        if isinstance(val, str) and re.match(regex_pattern, val):
-            return to_value
-        if val in [None, np.nan] or (isinstance(val, float) and not np.isfinite(val)):
-            return to_value
-        return val
+        return clean_empty_value(val, to_value)
 
     def replace_col(col):
         if col.name in exclude_columns:
@@ -198,6 +338,16 @@ def fix_empty_values(df, exclude_columns=None, to_value=None):
         if pd.api.types.is_numeric_dtype(col) or pd.api.types.is_datetime64_any_dtype(
             col
         ):
+            # A numpy column with nothing missing or infinite would come back unchanged,
+            # so skip the replace and its copy
+            if isinstance(col.dtype, np.dtype):
+                values = col.to_numpy()
+                if values.dtype.kind in "iub":
+                    return col
+                if values.dtype.kind == "f" and np.isfinite(values).all():
+                    return col
+                if values.dtype.kind == "M" and not np.isnat(values).any():
+                    return col
             return col.replace([np.nan, np.inf, -np.inf, None], to_value)
 
         uuid = str(uuid4())
@@ -209,9 +359,103 @@ def fix_empty_values(df, exclude_columns=None, to_value=None):
             .replace(uuid, to_value)
         )
 
+    if inplace:
+        for name in df.columns:
+            col = df[name]
+            cleaned = replace_col(col)
+            if cleaned is not col:
+                df[name] = cleaned
+        return df
+
     return df.apply(replace_col)
 
 
+def format_dates_ymd(dates):
+    """
+    Format a datetime Series as YYYY-MM-DD strings with a single numpy cast.
+    Same output as dt.strftime("%Y-%m-%d") without a per-element format call; NaT becomes None.
+    """
+    if getattr(dates.dt, "tz", None) is not None:
+        dates = dates.dt.tz_localize(None)  # keep wall-clock dates, like strftime
+    # Cast from the column's own unit (pandas may store s/ms/us) without an ns round trip
+    values = dates.to_numpy()
+    formatted = values.astype("datetime64[D]").astype("U10")
+    missing = np.isnat(values)
+    if not missing.any():
+        return formatted
+    formatted = formatted.astype(object)
+    formatted[missing] = None
+    return formatted
+
+
+# infer_dtype results that convert_dtypes maps onto a flat pyarrow type
+_ARROW_INFERRED_TYPES = {
+    "string",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "boolean",
+}
+
+
+def to_arrow_dtypes(df):
+    """
+    Store string and numeric columns as pyarrow-backed dtypes, which keep strings in one
+    Arrow buffer instead of a Python str per cell. Nested columns (lists, dicts) stay
+    object so their values are emitted unchanged. No-op when pyarrow is not installed.
+    """
+    if pyarrow is None or df.empty:
+        return df
+
+    arrow_cols = [
+        col
+        for col in df.columns
+        if pd.api.types.infer_dtype(df[col], skipna=True) in _ARROW_INFERRED_TYPES
+    ]
+    if arrow_cols:
+        df[arrow_cols] = df[arrow_cols].convert_dtypes(dtype_backend="pyarrow")
+    return df
+
+
+def prepare_for_records(df):
+    """
+    Convert columns that itertuples would box per value into plain Python objects once.
+    Nullable extension columns (e.g. Int64, pyarrow dtypes) would yield numpy scalars and
+    pd.NA, and datetime64 columns a pd.Timestamp per cell; missing values become None.
+    """
+    convert_cols = [
+        col
+        for col, dtype in df.dtypes.items()
+        if pd.api.types.is_datetime64_any_dtype(dtype)
+        or isinstance(dtype, pd.ArrowDtype)
+        or (pd.api.types.is_extension_array_dtype(dtype) and dtype.kind in "iufb")
+    ]
+    if not convert_cols:
+        return df
+
+    df = df.copy(deep=False)
+    for col in convert_cols:
+        if pd.api.types.is_datetime64_any_dtype(df[col].dtype):
+            # older pandas returns an ndarray here, newer a Series
+            values = pd.Series(df[col].dt.to_pydatetime(), index=df.index, dtype=object)
+        else:
+            values = df[col].astype(object)
+        df[col] = values.where(df[col].notna(), None)
+    return df
+
+
+def iter_records(df):
+    """
+    Yield one dict per DataFrame row, zipping the column names with itertuples rows.
+    Avoids materializing the full list of dicts that df.to_dict("records") builds.
+    Keys are interned, so every record shares the schema's property name strings.
+    """
+    df = prepare_for_records(df)
+    columns = [sys.intern(c) if type(c) is str else c for c in df.columns]
+    for row in df.itertuples(index=False, name=None):
+        yield dict(zip(columns, row))
+
+
 def flatten_list(lst):
     return [v for item in lst for v in (item if isinstance(item, list) else [item])]
 
@@ -2,25 +2,289 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
 import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from singer_sdk import typing as th
 from singer_sdk.helpers.types import Context
 import pandas as pd
-from uuid import uuid5, NAMESPACE_DNS
-from tap_yahooquery.client import YahooQueryStream
-from tap_yahooquery.schema import INCOME_STMT_SCHEMA, ALL_FINANCIAL_DATA_SCHEMA
+from uuid import UUID, uuid5, NAMESPACE_DNS
+from tap_yahooquery.client import YahooQueryStream, lazy_schema
+from tap_yahooquery.schema import income_stmt_schema, all_financial_data_schema
 from tap_yahooquery.helpers import (
     TickerFetcher,
+    clean_empty_value,
     fix_empty_values,
     clean_strings,
+    format_dates_ymd,
+    iter_records,
+    to_arrow_dtypes,
 )
 
+# yahooquery formats earnings dates as "%Y-%m-%d %H:%M:S" (literal S), e.g. "2024-01-25 05:59:S"
+_DATE_CLEANUP = re.compile(r"S|:+(?=S*$)")
+_NEEDS_SECONDS = re.compile(r"^[^:]*:[^:]*$")
+
+# Yahoo column names that clean_strings would split incorrectly (e.g. EBITDA -> e_b_i_t_d_a)
+_INCOME_STMT_RENAME = {
+    "symbol": "ticker",
+    "BasicEPS": "basic_eps",
+    "DilutedEPS": "diluted_eps",
+    "NormalizedEBITDA": "normalized_ebitda",
+    "DilutedNIAvailtoComStockholders": "diluted_ni_avail_to_common_stock_holders",
+    "EBIT": "ebit",
+    "EBITDA": "ebitda",
+    "GrossPPE": "gross_ppe",
+    "GainOnSaleOfPPE": "gain_on_sale_of_ppe",
+    "OtherGandA": "other_g_and_a",
+    "OtherunderPreferredStockDividend": "other_under_preferred_stock_dividend",
+}
+
+_ALL_FINANCIAL_RENAME = {
+    "symbol": "ticker",
+    "BasicEPS": "basic_eps",
+    "DilutedEPS": "diluted_eps",
+    "NormalizedEBITDA": "normalized_ebitda",
+    "DilutedNIAvailtoComStockholders": "diluted_ni_avail_to_common_stock_holders",
+    "EBIT": "ebit",
+    "EBITDA": "ebitda",
+    "GainOnSaleOfPPE": "gain_on_sale_of_ppe",
+    "EnterprisesValueEBITDARatio": "enterprises_value_ebitda_ratio",
+    "NetPPE": "net_ppe",
+    "NetPPEPurchaseAndSale": "net_ppe_purchase_and_sale",
+    "PurchaseOfPPE": "purchase_of_ppe",
+    "GrossPPE": "gross_ppe",
+    "InvestmentinFinancialAssets": "investment_in_financial_assets",
+}
+
+
+# Raw secFilings keys -> emitted field, renamed once here instead of per ticker
+_SEC_FILING_KEYS = (
+    "date",
+    "epochDate",
+    "type",
+    "title",
+    "edgarUrl",
+    "exhibits",
+    "maxAge",
+)
+_SEC_FILING_FIELDS = dict(zip(_SEC_FILING_KEYS, clean_strings(_SEC_FILING_KEYS)))
+
+
+# Earnings columns in emitted order, with the dtype used for tickers without earnings data
+_EARNINGS_DTYPES = {
+    "ticker": "object",
+    "date": "object",
+    "type": "object",
+    "actual": "float64",
+    "estimate": "float64",
+    "currency": "object",
+    "max_age": "Int64",
+    "current_quarter_estimate": "float64",
+    "current_quarter_estimate_date": "object",
+    "current_quarter_estimate_year": "float64",
+    "earnings_date": "object",
+    "is_earnings_date_estimate": "boolean",
+    "revenue": "float64",
+    "earnings": "float64",
+}
+_EARNINGS_COLUMNS = tuple(_EARNINGS_DTYPES)
+
+
+# earnings_trend column -> path into a yahooquery trend entry, in emitted order
+_EARNINGS_TREND_FIELDS = {
+    "ticker": ("symbol",),
+    "period": ("period",),
+    "end_date": ("endDate",),
+    "growth": ("growth",),
+    # Earnings Estimate
+    "earnings_avg": ("earningsEstimate", "avg"),
+    "earnings_low": ("earningsEstimate", "low"),
+    "earnings_high": ("earningsEstimate", "high"),
+    "earnings_year_ago_eps": ("earningsEstimate", "yearAgoEps"),
+    "earnings_num_analysts": ("earningsEstimate", "numberOfAnalysts"),
+    "earnings_growth": ("earningsEstimate", "growth"),
+    "earnings_currency": ("earningsEstimate", "earningsCurrency"),
+    # Revenue Estimate
+    "revenue_avg": ("revenueEstimate", "avg"),
+    "revenue_low": ("revenueEstimate", "low"),
+    "revenue_high": ("revenueEstimate", "high"),
+    "revenue_num_analysts": ("revenueEstimate", "numberOfAnalysts"),
+    "revenue_year_ago": ("revenueEstimate", "yearAgoRevenue"),
+    "revenue_growth": ("revenueEstimate", "growth"),
+    "revenue_currency": ("revenueEstimate", "revenueCurrency"),
+    # EPS Trend
+    "eps_trend_current": ("epsTrend", "current"),
+    "eps_trend_7days_ago": ("epsTrend", "7daysAgo"),
+    "eps_trend_30days_ago": ("epsTrend", "30daysAgo"),
+    "eps_trend_60days_ago": ("epsTrend", "60daysAgo"),
+    "eps_trend_90days_ago": ("epsTrend", "90daysAgo"),
+    "eps_trend_currency": ("epsTrend", "epsTrendCurrency"),
+    # EPS Revisions
+    "eps_up_last_7days": ("epsRevisions", "upLast7days"),
+    "eps_up_last_30days": ("epsRevisions", "upLast30days"),
+    "eps_down_last_7days": ("epsRevisions", "downLast7Days"),
+    "eps_down_last_30days": ("epsRevisions", "downLast30days"),
+    "eps_down_last_90days": ("epsRevisions", "downLast90days"),
+    "eps_revisions_currency": ("epsRevisions", "epsRevisionsCurrency"),
+}
+
+
+# One entry per distinct column selection, normally a single one per run
+@functools.lru_cache(maxsize=16)
+def trend_columns_builder(
+    fields: tuple[tuple[str, tuple[str, ...]], ...],
+) -> t.Callable:
+    """
+    Generate a function that turns [(symbol, trend), ...] into one list per field.
+    Specialized once per column selection, so each section dict is looked up once
+    per trend and every key is a constant in the generated bytecode.
+    """
+    sections = sorted({path[0] for _, path in fields if len(path) == 2})
+    section_vars = {section: f"s{i}" for i, section in enumerate(sections)}
+
+    lines = ["def build(trends):"]
+    lines += [f"    c{i} = []" for i in range(len(fields))]
+    lines.append("    for symbol, trend in trends:")
+    lines += [
+        f"        {var} = trend.get({section!r}) or {{}}"
+        for section, var in section_vars.items()
+    ]
+    for i, (_, path) in enumerate(fields):
+        if path == ("symbol",):
+            value = "symbol"
+        elif len(path) == 1:
+            value = f"trend.get({path[0]!r})"
+        else:
+            value = f"{section_vars[path[0]]}.get({path[1]!r})"
+        lines.append(f"        c{i}.append({value})")
+    columns = ", ".join(f"{column!r}: c{i}" for i, (column, _) in enumerate(fields))
+    lines.append(f"    return {{{columns}}}")
+
+    namespace = {}
+    exec(compile("\n".join(lines), "<earnings_trend_builder>", "exec"), namespace)
+    return namespace["build"]
 
-def make_uuid(row, cols):
-    key = "".join([f"{str(row[col])}|{col}|" for col in cols if col in row])
+
+def make_uuid(key: str):
     return uuid5(NAMESPACE_DNS, key)
 
 
+def make_blake2b_uuid(key: str):
+    return UUID(bytes=hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest())
+
+
+def make_surrogate_keys(
+    df: pd.DataFrame, cols: list[str], key_hash: str = "uuid5"
+) -> list:
+    """Build one uuid per row from the values of cols, walking plain itertuples rows."""
+    make_key = make_blake2b_uuid if key_hash == "blake2b" else make_uuid
+    cols = [col for col in cols if col in df.columns]
+    return [
+        make_key("".join([f"{value}|{col}|" for value, col in zip(row, cols)]))
+        # astype(str) first so keys render values exactly as before (e.g. NA -> "nan")
+        for row in df[cols].astype(str).itertuples(index=False, name=None)
+    ]
+
+
+def rename_columns(df: pd.DataFrame, rename: dict[str, str]) -> None:
+    """Apply the explicit rename map and clean_strings in one column assignment."""
+    df.columns = clean_strings([rename.get(col, col) for col in df.columns])
+
+
+def promote_ticker(df: pd.DataFrame) -> pd.DataFrame:
+    """Move the symbol index level into a leading ticker column without reset_index copying the frame."""
+    df.insert(0, "ticker", df.index.get_level_values(0))
+    df.index = df.index.droplevel(0) if df.index.nlevels > 1 else pd.RangeIndex(len(df))
+    return df
+
+
+def _normalize_sec_filings(df: pd.DataFrame) -> pd.DataFrame:
+    df = promote_ticker(df)
+    df.columns = clean_strings(df.columns)
+    return fix_empty_values(df, inplace=True)
+
+
+def _normalize_income_statement(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.reset_index()
+    rename_columns(df, _INCOME_STMT_RENAME)
+    df["as_of_date"] = format_dates_ymd(df["as_of_date"])
+    return fix_empty_values(df, inplace=True)
+
+
+def _normalize_all_financial_data(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.reset_index()
+    rename_columns(df, _ALL_FINANCIAL_RENAME)
+    df["as_of_date"] = format_dates_ymd(df["as_of_date"])
+    return fix_empty_values(df, inplace=True)
+
+
+def _normalize_corporate_events(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.rename_axis(index={"symbol": "ticker"}).reset_index()
+    # nullable Int64 keeps missing significance as NA instead of raising on NaN
+    df["significance"] = df["significance"].astype("Int64")
+    df.columns = clean_strings(df.columns)
+    df["date"] = format_dates_ymd(df["date"])
+    return fix_empty_values(df, inplace=True)
+
+
+def _normalize_dividend_history(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.rename_axis(index={"symbol": "ticker"}).reset_index()
+    return fix_empty_values(df, inplace=True)
+
+
+def _normalize_corporate_guidance(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.rename_axis(index={"symbol": "ticker"}).reset_index()
+    df.columns = clean_strings(df.columns)
+    df["significance"] = df["significance"].astype("Int64")
+    return fix_empty_values(df, inplace=True)
+
+
+def _normalize_company_officers(
+    df: pd.DataFrame, key_hash: str = "uuid5"
+) -> pd.DataFrame:
+    df = promote_ticker(df)
+    df.columns = clean_strings(df.columns)
+    surrogate_key_cols = [
+        "ticker",
+        "officers",
+        "name",
+        "age",
+        "title",
+        "year_born",
+        "fiscal_year",
+        "total_pay",
+        "exercised_value",
+        "unexercised_value",
+    ]
+    df["surrogate_key"] = make_surrogate_keys(df, surrogate_key_cols, key_hash)
+    return fix_empty_values(df, inplace=True)
+
+
+_NORMALIZERS = {
+    "sec_filings": _normalize_sec_filings,
+    "income_statement": _normalize_income_statement,
+    "all_financial_data": _normalize_all_financial_data,
+    "corporate_events": _normalize_corporate_events,
+    "dividend_history": _normalize_dividend_history,
+    "corporate_guidance": _normalize_corporate_guidance,
+    "company_officers": _normalize_company_officers,
+}
+
+
+def normalize_frame(endpoint: str, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """
+    Rename and clean a raw yahooquery DataFrame for the given endpoint.
+    Pure and module-level so it can be pickled into worker processes.
+    """
+    return _NORMALIZERS[endpoint](df, **kwargs)
+
+
 class TickersStream(YahooQueryStream):
     """Stream to fetch all available tickers."""
 
@@ -28,14 +292,17 @@ class TickersStream(YahooQueryStream):
     primary_keys = ["ticker"]
     _use_cached_tickers_default = False
 
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("name", th.StringType),
-        th.Property("segment", th.StringType),
-    ).to_dict()
-
-    def get_ticker_list(self) -> list[str] | None:
-        """Get list of selected tickers from config."""
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("name", th.StringType),
+            th.Property("segment", th.StringType),
+        ).to_dict()
+
+    @functools.cached_property
+    def _ticker_list(self) -> tuple[str, ...] | None:
+        """Selected tickers parsed once from config (the config is not mutated after init)."""
         tickers_config = self.config.get("tickers", {})
         selected_tickers = tickers_config.get("select_tickers")
 
@@ -43,15 +310,21 @@ class TickersStream(YahooQueryStream):
             return None
 
         if isinstance(selected_tickers, str):
-            return selected_tickers.split(",")
+            return tuple(selected_tickers.split(","))
 
         if isinstance(selected_tickers, list):
             if selected_tickers == ["*"]:
                 return None
-            return selected_tickers
+            return tuple(selected_tickers)
 
         return None
 
+    def get_ticker_list(self) -> list[str] | None:
+        """Get list of selected tickers from config."""
+        if self._ticker_list is None:
+            return None
+        return list(self._ticker_list)
+
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get ticker records - no partitions, handles all tickers directly."""
         selected_tickers = self.get_ticker_list()
@@ -65,11 +338,119 @@ class TickersStream(YahooQueryStream):
             ticker_fetcher = TickerFetcher()
             ticker_records = ticker_fetcher.fetch_specific_tickers(selected_tickers)
 
-        for record in ticker_records:
-            yield record
+        yield from ticker_records
+
+
+# Shared by every stream's prefetch window; threads only start on first submit
+_FETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("TAP_YQ_WORKERS", "16")),
+    thread_name_prefix="tap-yahooquery-fetch",
+)
 
 
-class BaseFinancialStream(YahooQueryStream):
+class PrefetchMixin:
+    """
+    Keep the next fetch_concurrency partition tickers in flight on the shared fetch pool.
+    The SDK still drives partitions in order; each get_records call just picks up
+    its already-running future, so network waits overlap with parsing.
+    """
+
+    _prefetch_futures: dict[str, Future] | None = None
+    _prefetch_index: dict[str, int] | None = None
+    # Per-ticker fetch, which prefetch_across_streams also starts on behalf of this stream
+    _fetch_for_ticker: t.Callable[[str], t.Any] | None = None
+
+    def _prefetched(self, ticker: str, fetch: t.Callable[[str], t.Any]) -> t.Any:
+        """Return fetch(ticker), submitting fetches for the upcoming tickers as well."""
+        try:
+            return self._prefetch_window(ticker, fetch)
+        finally:
+            self._finish_partition(ticker)
+
+    def _prefetch_window(self, ticker: str, fetch: t.Callable[[str], t.Any]) -> t.Any:
+        concurrency = self.config.get("fetch_concurrency", 8)
+        tickers = self._partition_tickers
+        if concurrency <= 1 or not tickers:
+            return fetch(ticker)
+
+        if self._prefetch_index is None:
+            self._prefetch_index = {ticker: i for i, ticker in enumerate(tickers)}
+            self._prefetch_futures = {}
+        position = self._prefetch_index.get(ticker)
+        if position is None:
+            return fetch(ticker)
+
+        for upcoming in tickers[position : position + concurrency]:
+            if upcoming not in self._prefetch_futures:
+                future = self._take_cross_stream_future(upcoming)
+                if future is None:
+                    future = _FETCH_EXECUTOR.submit(fetch, upcoming)
+                self._prefetch_futures[upcoming] = future
+
+        # Once this stream's window runs past its last ticker, fill the freed slots
+        # with the next stream's first tickers, never more than one window of them
+        ahead = position + concurrency - len(tickers) + 1
+        if ahead > 0 and self.config.get("prefetch_across_streams", False):
+            self._submit_across_streams(min(ahead, concurrency))
+
+        future = self._prefetch_futures.pop(ticker)
+        if position == len(tickers) - 1:
+            self._prefetch_index = None
+        return future.result()
+
+    def _take_cross_stream_future(self, ticker: str) -> Future | None:
+        """Pop the fetch an earlier stream already started for this stream and ticker."""
+        with self._tap._cross_stream_lock:
+            return self._tap._cross_stream_futures.pop((self.name, ticker), None)
+
+    @functools.cached_property
+    def _next_prefetch_stream(self) -> PrefetchMixin | None:
+        """The next selected stream whose fetches can be started ahead of its sync."""
+        streams = list(self._tap.streams.values())
+        for stream in streams[streams.index(self) + 1 :]:
+            if stream.selected:
+                if (
+                    isinstance(stream, PrefetchMixin)
+                    and stream._fetch_for_ticker
+                    and stream.use_cached_tickers
+                ):
+                    return stream
+                return None
+        return None
+
+    def _submit_across_streams(self, count: int) -> None:
+        """Start the next stream's fetches for its first count tickers."""
+        stream = self._next_prefetch_stream
+        if stream is None:
+            return
+
+        # Same order and segment filtering as the next stream's own partitions
+        upcoming = [
+            ticker
+            for ticker, record in (self._all_tickers or {}).items()
+            if stream._valid_segments is None
+            or record.get("segment") in stream._valid_segments
+        ][:count]
+        with self._tap._cross_stream_lock:
+            for ticker in upcoming:
+                key = (stream.name, ticker)
+                if key not in self._tap._cross_stream_futures:
+                    self._tap._cross_stream_futures[key] = _FETCH_EXECUTOR.submit(
+                        stream._fetch_for_ticker, ticker
+                    )
+
+    def _release_sync_state(self) -> None:
+        """Drop fetches started for this stream that its sync never picked up."""
+        super()._release_sync_state()
+        with self._tap._cross_stream_lock:
+            leftovers = [
+                key for key in self._tap._cross_stream_futures if key[0] == self.name
+            ]
+            for key in leftovers:
+                self._tap._cross_stream_futures.pop(key).cancel()
+
+
+class BaseFinancialStream(PrefetchMixin, YahooQueryStream):
     _use_cached_tickers_default = True
     _valid_segments = [
         "stock_tickers",
@@ -78,6 +459,54 @@ class BaseFinancialStream(YahooQueryStream):
         "european_funds",
     ]
 
+    _process_pool: ProcessPoolExecutor | None = None
+    _process_pool_slots: threading.BoundedSemaphore | None = None
+
+    def _prefetched(self, ticker: str, fetch: t.Callable[[str], t.Any]) -> t.Any:
+        if self._process_pool is None and self.config.get(
+            "normalize_in_processes", False
+        ):
+            self._open_process_pool()
+        return super()._prefetched(ticker, fetch)
+
+    def _open_process_pool(self) -> None:
+        """Open the normalize process pool, held until the last partition is fetched."""
+        # Created here on the main thread and started by forkserver (spawn where that
+        # is unavailable), so workers never fork a copy of the fetch threads' locks
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        max_workers = os.cpu_count() or 1
+        self._process_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+        )
+        # Cap in-flight frames so pending work can't pile up in memory
+        self._process_pool_slots = threading.BoundedSemaphore(2 * max_workers)
+
+    def _release_sync_state(self) -> None:
+        super()._release_sync_state()
+        pool, self._process_pool = self._process_pool, None
+        self._process_pool_slots = None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def _normalize(self, endpoint: str, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        """Normalize a raw DataFrame, off the GIL when normalize_in_processes is set."""
+        # Delisted or missing tickers come back empty; skip the rename/clean pipeline
+        if df is None or (isinstance(df, pd.DataFrame) and df.empty):
+            return pd.DataFrame(columns=self.expected_columns)
+
+        # Fetches started across streams can run before this stream opens its pool
+        pool, slots = self._process_pool, self._process_pool_slots
+        if pool is None or slots is None:
+            return normalize_frame(endpoint, df, **kwargs)
+
+        with slots:
+            return pool.submit(normalize_frame, endpoint, df, **kwargs).result()
+
 
 class SecFilingsStream(BaseFinancialStream):
     """Stream for SEC filings data."""
@@ -90,43 +519,75 @@ class SecFilingsStream(BaseFinancialStream):
         "private_companies_tickers",
     ]
 
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("date", th.DateType),
-        th.Property("epoch_date", th.DateTimeType),
-        th.Property("type", th.StringType),
-        th.Property("title", th.StringType),
-        th.Property("edgar_url", th.StringType),
-        th.Property(
-            "exhibits",
-            th.ArrayType(
-                th.ObjectType(
-                    th.Property("type", th.StringType),
-                    th.Property("url", th.StringType),
-                    th.Property("downloadUrl", th.StringType),
-                )
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("date", th.DateType),
+            th.Property("epoch_date", th.DateTimeType),
+            th.Property("type", th.StringType),
+            th.Property("title", th.StringType),
+            th.Property("edgar_url", th.StringType),
+            th.Property(
+                "exhibits",
+                th.ArrayType(
+                    th.ObjectType(
+                        th.Property("type", th.StringType),
+                        th.Property("url", th.StringType),
+                        th.Property("downloadUrl", th.StringType),
+                    )
+                ),
             ),
-        ),
-        th.Property("max_age", th.NumberType),
-    ).to_dict()
+            th.Property("max_age", th.NumberType),
+        ).to_dict()
+
+    @property
+    def _quote_summary_module(self) -> str | None:
+        # The DataFrame path goes through yahooquery's sec_filings, not the raw module
+        if self._get_stream_config().get("use_dataframe", False):
+            return None
+        return "secFilings"
 
     def _fetch_sec_filings(self, ticker: str) -> pd.DataFrame:
         """Fetch SEC filings."""
-        df = self._fetch_with_crumb_retry(ticker, "sec_filings", is_callable=False)
+        df = self._fetch_data(ticker, "sec_filings", is_callable=False)
         assert isinstance(
             df, pd.DataFrame
         ), f"sec_filings did not return a DataFrame for ticker {ticker}."
-        df = df.reset_index(level=0).rename(columns={"symbol": "ticker"})
-        df.columns = clean_strings(df.columns)
-        df = fix_empty_values(df)
+        df = self._normalize("sec_filings", df)
+        if self.config.get("arrow_dtypes", False):
+            df = to_arrow_dtypes(df)
         return df
 
+    def _fetch_sec_filings_raw(self, ticker: str) -> list[dict]:
+        """Fetch the secFilings module as parsed JSON, skipping yahooquery's DataFrame."""
+        data = self._fetch_data(
+            ticker, "get_modules", endpoint="sec_filings", modules="secFilings"
+        )
+        ticker_data = data.get(ticker) if isinstance(data, dict) else None
+        if not isinstance(ticker_data, dict):
+            return []
+        return ticker_data.get("filings") or []
+
+    def _fetch_for_ticker(self, ticker: str) -> pd.DataFrame | list[dict]:
+        if self._get_stream_config().get("use_dataframe", False):
+            return self._fetch_sec_filings(ticker)
+        return self._fetch_sec_filings_raw(ticker)
+
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get SEC filings records - context will have ticker from partition."""
         ticker = self._get_ticker_from_context(context)
         self.logger.info(f"Processing SEC filings for ticker: {ticker}")
-        df = self._fetch_sec_filings(ticker)
-        for record in df.to_dict(orient="records"):
+        fetched = self._prefetched(ticker, self._fetch_for_ticker)
+        if self._get_stream_config().get("use_dataframe", False):
+            yield from iter_records(fetched)
+            return
+
+        # Same cleaning fix_empty_values gives the DataFrame path
+        for filing in fetched:
+            record = {"ticker": ticker}
+            for key, field in _SEC_FILING_FIELDS.items():
+                record[field] = clean_empty_value(filing.get(key))
             yield record
 
 
@@ -140,42 +601,26 @@ class IncomeStmtStream(BaseFinancialStream):
         "private_companies_tickers",
     ]
 
-    schema = INCOME_STMT_SCHEMA
+    schema = lazy_schema(income_stmt_schema)
 
     def _fetch_income_statement(self, ticker: str) -> pd.DataFrame:
         """Fetch income statement."""
-        df = self._fetch_with_crumb_retry(ticker, "income_statement")
+        df = self._fetch_data(ticker, "income_statement")
         assert isinstance(
             df, pd.DataFrame
         ), f"income_statement did not return a DataFrame for ticker {ticker}."
-        df = df.reset_index().rename(
-            columns={
-                "symbol": "ticker",
-                "BasicEPS": "basic_eps",
-                "DilutedEPS": "diluted_eps",
-                "NormalizedEBITDA": "normalized_ebitda",
-                "DilutedNIAvailtoComStockholders": "diluted_ni_avail_to_common_stock_holders",
-                "EBIT": "ebit",
-                "EBITDA": "ebitda",
-                "GrossPPE": "gross_ppe",
-                "GainOnSaleOfPPE": "gain_on_sale_of_ppe",
-                "OtherGandA": "other_g_and_a",
-                "OtherunderPreferredStockDividend": "other_under_preferred_stock_dividend",
-            }
-        )
-        df = fix_empty_values(df)
-        df.columns = clean_strings(df.columns)
-        df["as_of_date"] = df["as_of_date"].dt.strftime("%Y-%m-%d")
-        return df
+        return self._normalize("income_statement", df)
+
+    def _fetch_for_ticker(self, ticker: str) -> pd.DataFrame:
+        return self._fetch_income_statement(ticker)
 
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get financial records - context will have ticker from partition."""
         ticker = self._get_ticker_from_context(context)
         self.logger.info(f"Processing income_stmt for ticker: {ticker}")
         try:
-            df = self._fetch_income_statement(ticker)
-            for record in df.to_dict(orient="records"):
-                yield record
+            df = self._prefetched(ticker, self._fetch_for_ticker)
+            yield from iter_records(df)
         except Exception as e:
             self.logger.error(f"Error getting income_stmt for ticker {ticker}: {e}")
 
@@ -186,34 +631,16 @@ class AllFinancialDataStream(BaseFinancialStream):
     name = "all_financial_data"
     primary_keys = ["ticker", "as_of_date"]
 
-    schema = ALL_FINANCIAL_DATA_SCHEMA
+    schema = lazy_schema(all_financial_data_schema)
 
     def _fetch_all_financial_data(self, ticker: str) -> pd.DataFrame:
         """Fetch income statement."""
-        df = self._fetch_with_crumb_retry(ticker, "all_financial_data")
+        df = self._fetch_data(ticker, "all_financial_data")
         assert isinstance(df, pd.DataFrame)
-        df = df.reset_index().rename(
-            columns={
-                "symbol": "ticker",
-                "BasicEPS": "basic_eps",
-                "DilutedEPS": "diluted_eps",
-                "NormalizedEBITDA": "normalized_ebitda",
-                "DilutedNIAvailtoComStockholders": "diluted_ni_avail_to_common_stock_holders",
-                "EBIT": "ebit",
-                "EBITDA": "ebitda",
-                "GainOnSaleOfPPE": "gain_on_sale_of_ppe",
-                "EnterprisesValueEBITDARatio": "enterprises_value_ebitda_ratio",
-                "NetPPE": "net_ppe",
-                "NetPPEPurchaseAndSale": "net_ppe_purchase_and_sale",
-                "PurchaseOfPPE": "purchase_of_ppe",
-                "GrossPPE": "gross_ppe",
-                "InvestmentinFinancialAssets": "investment_in_financial_assets",
-            }
-        )
-        df.columns = clean_strings(df.columns)
-        df["as_of_date"] = df["as_of_date"].dt.strftime("%Y-%m-%d")
-        df = fix_empty_values(df)
-        return df
+        return self._normalize("all_financial_data", df)
+
+    def _fetch_for_ticker(self, ticker: str) -> pd.DataFrame:
+        return self._fetch_all_financial_data(ticker)
 
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get financial records - context will have ticker from partition."""
@@ -222,9 +649,8 @@ class AllFinancialDataStream(BaseFinancialStream):
         self.logger.info(f"Processing all_financial_data for ticker: {ticker}")
 
         try:
-            df = self._fetch_all_financial_data(ticker)
-            for record in df.to_dict(orient="records"):
-                yield record
+            df = self._prefetched(ticker, self._fetch_for_ticker)
+            yield from iter_records(df)
         except Exception as e:
             self.logger.error(
                 f"Error getting all_financial_data for ticker {ticker}: {e}"
@@ -241,32 +667,32 @@ class CorporateEventsStream(BaseFinancialStream):
         "private_companies_tickers",
     ]
 
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("date", th.DateTimeType),
-        th.Property("id", th.IntegerType),
-        th.Property("significance", th.IntegerType),
-        th.Property("headline", th.StringType),
-        th.Property("description", th.StringType),
-        th.Property("parent_topics", th.StringType),
-    ).to_dict()
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("date", th.DateTimeType),
+            th.Property("id", th.IntegerType),
+            th.Property("significance", th.IntegerType),
+            th.Property("headline", th.StringType),
+            th.Property("description", th.StringType),
+            th.Property("parent_topics", th.StringType),
+        ).to_dict()
 
     def _fetch_corporate_events(self, ticker: str) -> pd.DataFrame:
         """Fetch corporate events."""
-        df = self._fetch_with_crumb_retry(ticker, "corporate_events", is_callable=False)
-        df = fix_empty_values(df.reset_index())
-        df = df.rename(columns={"symbol": "ticker"})
-        df["significance"] = df["significance"].astype(int)
-        df.columns = clean_strings(df.columns)
-        df["date"] = df["date"].dt.strftime("%Y-%m-%d")
-        return df
+        df = self._fetch_data(ticker, "corporate_events", is_callable=False)
+        return self._normalize("corporate_events", df)
+
+    def _fetch_for_ticker(self, ticker: str) -> pd.DataFrame:
+        return self._fetch_corporate_events(ticker)
 
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         ticker = self._get_ticker_from_context(context)
         self.logger.info(f"Processing corporate_events for ticker: {ticker}")
         try:
-            df = self._fetch_corporate_events(ticker)
-            yield from df.to_dict(orient="records")
+            df = self._prefetched(ticker, self._fetch_for_ticker)
+            yield from iter_records(df)
         except Exception as e:
             self.logger.error(
                 f"Error getting corporate_events for ticker {ticker}: {e}"
@@ -278,32 +704,33 @@ class CalendarEventsStream(BaseFinancialStream):
 
     name = "calendar_events"
     primary_keys = ["ticker", "event_type", "event_date"]
-
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("event_type", th.StringType, required=True),
-        th.Property("event_date", th.DateTimeType, required=True),
-        th.Property("event_category", th.StringType),
-        th.Property("event_subtype", th.StringType),
-        th.Property("priority_level", th.IntegerType),
-        th.Property("market_impact_expected", th.StringType),
-        th.Property("event_description", th.StringType),
-        th.Property("earnings_average", th.NumberType),
-        th.Property("earnings_low", th.NumberType),
-        th.Property("earnings_high", th.NumberType),
-        th.Property("revenue_average", th.NumberType),
-        th.Property("revenue_low", th.NumberType),
-        th.Property("revenue_high", th.NumberType),
-        th.Property("is_estimate", th.BooleanType),
-        th.Property("dividend_date", th.DateTimeType),
-        th.Property("timestamp_extracted", th.DateTimeType),
-    ).to_dict()
+    _quote_summary_module = "calendarEvents"
+
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("event_type", th.StringType, required=True),
+            th.Property("event_date", th.DateTimeType, required=True),
+            th.Property("event_category", th.StringType),
+            th.Property("event_subtype", th.StringType),
+            th.Property("priority_level", th.IntegerType),
+            th.Property("market_impact_expected", th.StringType),
+            th.Property("event_description", th.StringType),
+            th.Property("earnings_average", th.NumberType),
+            th.Property("earnings_low", th.NumberType),
+            th.Property("earnings_high", th.NumberType),
+            th.Property("revenue_average", th.NumberType),
+            th.Property("revenue_low", th.NumberType),
+            th.Property("revenue_high", th.NumberType),
+            th.Property("is_estimate", th.BooleanType),
+            th.Property("dividend_date", th.DateTimeType),
+            th.Property("timestamp_extracted", th.DateTimeType),
+        ).to_dict()
 
     def _fetch_calendar_events(self, ticker: str) -> pd.DataFrame:
         """Fetch calendar events."""
-        data = self._fetch_with_crumb_retry(
-            ticker, "calendar_events", is_callable=False
-        )
+        data = self._fetch_data(ticker, "calendar_events", is_callable=False)
 
         if not data or ticker not in data:
             return pd.DataFrame()
@@ -317,78 +744,95 @@ class CalendarEventsStream(BaseFinancialStream):
                 return pd.DataFrame()
 
             ticker_data = data[ticker]
-            records = []
+            timestamp_extracted = pd.Timestamp.utcnow()
+            frames = []
 
             # Handle earnings events
             if "earnings" in ticker_data:
                 earnings = ticker_data["earnings"]
-                earnings_dates = earnings.get("earningsDate", [])
-
-                for date in earnings_dates:
-                    try:
-                        if isinstance(date, str):
-                            # Remove trailing 'S' and handle incomplete time format
-                            clean_date = date.replace("S", "").rstrip(":")
-
-                            # If the time part is incomplete (like '05:59:'), pad with seconds
-                            if clean_date.count(":") == 2 and clean_date.endswith(":"):
-                                clean_date = clean_date + "00"
-                            elif clean_date.count(":") == 1:
-                                clean_date = clean_date + ":00"
-
-                            parsed_date = pd.to_datetime(clean_date)
-                        else:
-                            parsed_date = pd.to_datetime(date)
-
-                        record = {
-                            "ticker": ticker,
-                            "event_type": "earnings",
-                            "event_date": parsed_date,
-                            "event_category": "earnings",
-                            "earnings_average": earnings.get("earningsAverage"),
-                            "earnings_low": earnings.get("earningsLow"),
-                            "earnings_high": earnings.get("earningsHigh"),
-                            "revenue_average": earnings.get("revenueAverage"),
-                            "revenue_low": earnings.get("revenueLow"),
-                            "revenue_high": earnings.get("revenueHigh"),
-                            "is_estimate": earnings.get(
-                                "isEarningsDateEstimate", False
-                            ),
-                            "timestamp_extracted": pd.Timestamp.utcnow(),
-                        }
-                        records.append(record)
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Could not parse earnings date '{date}' for {ticker}: {e}"
+                event_dates = self._parse_earnings_dates(
+                    ticker, earnings.get("earningsDate", [])
+                )
+                if not event_dates.empty:
+                    frames.append(
+                        pd.DataFrame(
+                            {
+                                "ticker": ticker,
+                                "event_type": "earnings",
+                                "event_date": event_dates,
+                                "event_category": "earnings",
+                                "earnings_average": earnings.get("earningsAverage"),
+                                "earnings_low": earnings.get("earningsLow"),
+                                "earnings_high": earnings.get("earningsHigh"),
+                                "revenue_average": earnings.get("revenueAverage"),
+                                "revenue_low": earnings.get("revenueLow"),
+                                "revenue_high": earnings.get("revenueHigh"),
+                                "is_estimate": earnings.get(
+                                    "isEarningsDateEstimate", False
+                                ),
+                                "timestamp_extracted": timestamp_extracted,
+                            }
                         )
-                        continue
+                    )
 
             # Handle dividend events
             if "dividendDate" in ticker_data:
-                record = {
-                    "ticker": ticker,
-                    "event_type": "dividend",
-                    "event_date": pd.to_datetime(ticker_data["dividendDate"]),
-                    "event_category": "dividend",
-                    "dividend_date": pd.to_datetime(ticker_data["dividendDate"]),
-                    "timestamp_extracted": pd.Timestamp.utcnow(),
-                }
-                records.append(record)
-
-            df = pd.DataFrame(records) if records else pd.DataFrame()
-            df = fix_empty_values(df)
+                dividend_date = pd.to_datetime(ticker_data["dividendDate"])
+                frames.append(
+                    pd.DataFrame(
+                        [
+                            {
+                                "ticker": ticker,
+                                "event_type": "dividend",
+                                "event_date": dividend_date,
+                                "event_category": "dividend",
+                                "dividend_date": dividend_date,
+                                "timestamp_extracted": timestamp_extracted,
+                            }
+                        ]
+                    )
+                )
+
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            df = fix_empty_values(df, inplace=True)
             return df
 
         except Exception as e:
             self.logger.error(f"Error normalizing calendar events for {ticker}: {e}")
             return pd.DataFrame()
 
+    def _parse_earnings_dates(self, ticker: str, earnings_dates: list) -> pd.Series:
+        """Parse all earnings dates in one pass, dropping the ones that can't be parsed."""
+        dates = pd.Series(earnings_dates, dtype="object")
+        is_str = dates.map(type).eq(str)
+
+        # Remove the literal 'S' and trailing colons, then pad missing seconds
+        cleaned = dates[is_str].str.replace(_DATE_CLEANUP, "", regex=True)
+        cleaned = cleaned.mask(cleaned.str.match(_NEEDS_SECONDS), cleaned + ":00")
+
+        parsed = pd.concat(
+            [
+                pd.to_datetime(cleaned, format="mixed", errors="coerce"),
+                pd.to_datetime(dates[~is_str], errors="coerce"),
+            ]
+        ).sort_index()
+
+        invalid = parsed.isna() & dates.notna()
+        if invalid.any():
+            self.logger.warning(
+                f"Could not parse earnings dates {dates[invalid].tolist()} for {ticker}"
+            )
+        return parsed[~invalid].reset_index(drop=True)
+
+    def _fetch_for_ticker(self, ticker: str) -> pd.DataFrame:
+        return self._fetch_calendar_events(ticker)
+
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get calendar events records."""
         ticker = self._get_ticker_from_context(context)
         self.logger.info(f"Processing calendar events for ticker: {ticker}")
-        df = self._fetch_calendar_events(ticker)
-        yield from df.to_dict("records")
+        df = self._prefetched(ticker, self._fetch_for_ticker)
+        yield from iter_records(df)
 
 
 class DividendHistoryStream(BaseFinancialStream):
@@ -397,21 +841,28 @@ class DividendHistoryStream(BaseFinancialStream):
     name = "dividend_history"
     primary_keys = ["ticker", "date", "dividends"]
 
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("date", th.DateTimeType),
-        th.Property("dividends", th.NumberType),
-    ).to_dict()
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("date", th.DateTimeType),
+            th.Property("dividends", th.NumberType),
+        ).to_dict()
+
+    def _fetch_dividend_history(self, ticker: str) -> pd.DataFrame:
+        """Fetch dividend history."""
+        df = self._fetch_data(ticker, "dividend_history", start="1900-01-01")
+        return self._normalize("dividend_history", df)
+
+    def _fetch_for_ticker(self, ticker: str) -> pd.DataFrame:
+        return self._fetch_dividend_history(ticker)
 
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get dividend history records."""
         ticker = self._get_ticker_from_context(context)
         self.logger.info(f"Processing dividend history for ticker: {ticker}")
-        df = self._fetch_with_crumb_retry(
-            ticker, "dividend_history", start="1900-01-01"
-        )
-        df = fix_empty_values(df.reset_index()).rename(columns={"symbol": "ticker"})
-        yield from df.to_dict("records")
+        df = self._prefetched(ticker, self._fetch_for_ticker)
+        yield from iter_records(df)
 
 
 class CorporateGuidanceStream(BaseFinancialStream):
@@ -424,28 +875,32 @@ class CorporateGuidanceStream(BaseFinancialStream):
         "private_companies_tickers",
     ]
 
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("date", th.DateType),
-        th.Property("id", th.IntegerType),
-        th.Property("significance", th.IntegerType),
-        th.Property("headline", th.StringType),
-        th.Property("description", th.StringType),
-        th.Property("parent_topics", th.StringType),
-    ).to_dict()
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("date", th.DateType),
+            th.Property("id", th.IntegerType),
+            th.Property("significance", th.IntegerType),
+            th.Property("headline", th.StringType),
+            th.Property("description", th.StringType),
+            th.Property("parent_topics", th.StringType),
+        ).to_dict()
+
+    def _fetch_corporate_guidance(self, ticker: str) -> pd.DataFrame:
+        """Fetch corporate guidance."""
+        df = self._fetch_data(ticker, "corporate_guidance", is_callable=False)
+        return self._normalize("corporate_guidance", df)
+
+    def _fetch_for_ticker(self, ticker: str) -> pd.DataFrame:
+        return self._fetch_corporate_guidance(ticker)
 
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get corporate guidance records."""
         ticker = self._get_ticker_from_context(context)
         self.logger.info(f"Processing corporate guidance for ticker: {ticker}")
-        df = self._fetch_with_crumb_retry(
-            ticker, "corporate_guidance", is_callable=False
-        )
-        df = df.reset_index().rename(columns={"symbol": "ticker"})
-        df.columns = clean_strings(df.columns)
-        df["significance"] = df["significance"].astype(int)
-        df = fix_empty_values(df)
-        yield from df.to_dict("records")
+        df = self._prefetched(ticker, self._fetch_for_ticker)
+        yield from iter_records(df)
 
 
 class CompanyOfficersStream(BaseFinancialStream):
@@ -458,49 +913,39 @@ class CompanyOfficersStream(BaseFinancialStream):
         "private_companies_tickers",
     ]
 
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("officers", th.StringType),
-        th.Property("name", th.StringType),
-        th.Property("age", th.NumberType),
-        th.Property("title", th.StringType),
-        th.Property("year_born", th.NumberType),
-        th.Property("fiscal_year", th.IntegerType),
-        th.Property("total_pay", th.NumberType),
-        th.Property("exercised_value", th.NumberType),
-        th.Property("unexercised_value", th.NumberType),
-        th.Property("max_age", th.NumberType),
-        th.Property("surrogate_key", th.StringType),
-    ).to_dict()
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("officers", th.StringType),
+            th.Property("name", th.StringType),
+            th.Property("age", th.NumberType),
+            th.Property("title", th.StringType),
+            th.Property("year_born", th.NumberType),
+            th.Property("fiscal_year", th.IntegerType),
+            th.Property("total_pay", th.NumberType),
+            th.Property("exercised_value", th.NumberType),
+            th.Property("unexercised_value", th.NumberType),
+            th.Property("max_age", th.NumberType),
+            th.Property("surrogate_key", th.StringType),
+        ).to_dict()
+
+    def _fetch_company_officers(self, ticker: str) -> pd.DataFrame:
+        """Fetch company officers."""
+        df = self._fetch_data(ticker, "company_officers", is_callable=False)
+        # uuid5 keeps existing surrogate keys stable; blake2b is faster but rotates them
+        key_hash = self._get_stream_config().get("surrogate_key_hash", "uuid5")
+        return self._normalize("company_officers", df, key_hash=key_hash)
+
+    def _fetch_for_ticker(self, ticker: str) -> pd.DataFrame:
+        return self._fetch_company_officers(ticker)
 
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get company officers records."""
         ticker = self._get_ticker_from_context(context)
         self.logger.info(f"Processing company officers for ticker: {ticker}")
-        df = self._fetch_with_crumb_retry(ticker, "company_officers", is_callable=False)
-        df = df.reset_index(level=0).rename(columns={"symbol": "ticker"})
-        df.columns = clean_strings(df.columns)
-        surrogate_key_cols = [
-            "ticker",
-            "officers",
-            "name",
-            "age",
-            "title",
-            "year_born",
-            "fiscal_year",
-            "total_pay",
-            "exercised_value",
-            "unexercised_value",
-        ]
-        df["surrogate_key"] = df.apply(
-            lambda row: make_uuid(
-                row,
-                surrogate_key_cols,
-            ),
-            axis=1,
-        )
-        df = fix_empty_values(df)
-        yield from df.to_dict("records")
+        df = self._prefetched(ticker, self._fetch_for_ticker)
+        yield from iter_records(df)
 
 
 class EarningsStream(YahooQueryStream):
@@ -508,32 +953,35 @@ class EarningsStream(YahooQueryStream):
 
     name = "earnings"
     primary_keys = ["ticker", "date", "type"]
+    _quote_summary_module = "earnings"
     _valid_segments = [
         "stock_tickers",
         "private_companies_tickers",
     ]
 
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("date", th.StringType, required=True),
-        th.Property(
-            "type", th.StringType, required=True
-        ),  # 'eps', 'quarterly', 'yearly', 'summary', 'earnings_date'
-        th.Property("actual", th.NumberType),
-        th.Property("estimate", th.NumberType),
-        th.Property("revenue", th.NumberType),
-        th.Property("earnings", th.NumberType),
-        th.Property("currency", th.StringType),
-        th.Property("max_age", th.IntegerType),
-        th.Property("current_quarter_estimate", th.NumberType),
-        th.Property("current_quarter_estimate_date", th.StringType),
-        th.Property("current_quarter_estimate_year", th.NumberType),
-        th.Property("earnings_date", th.StringType),
-        th.Property("is_earnings_date_estimate", th.BooleanType),
-    ).to_dict()
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("date", th.StringType, required=True),
+            th.Property(
+                "type", th.StringType, required=True
+            ),  # 'eps', 'quarterly', 'yearly', 'summary', 'earnings_date'
+            th.Property("actual", th.NumberType),
+            th.Property("estimate", th.NumberType),
+            th.Property("revenue", th.NumberType),
+            th.Property("earnings", th.NumberType),
+            th.Property("currency", th.StringType),
+            th.Property("max_age", th.IntegerType),
+            th.Property("current_quarter_estimate", th.NumberType),
+            th.Property("current_quarter_estimate_date", th.StringType),
+            th.Property("current_quarter_estimate_year", th.NumberType),
+            th.Property("earnings_date", th.StringType),
+            th.Property("is_earnings_date_estimate", th.BooleanType),
+        ).to_dict()
 
     def _fetch_earnings(self, ticker: str) -> pd.DataFrame:
-        data = self._fetch_with_crumb_retry(ticker, "earnings", is_callable=False)
+        data = self._fetch_data(ticker, "earnings", is_callable=False)
         if not data or ticker not in data:
             self.logger.warning(f"No earnings data found for ticker: {ticker}")
             return pd.DataFrame()
@@ -544,110 +992,87 @@ class EarningsStream(YahooQueryStream):
         earnings_chart = d.get("earningsChart", {})
         financials_chart = d.get("financialsChart", {})
 
-        records = []
+        has_any = (
+            bool(earnings_chart.get("quarterly"))
+            or bool(financials_chart.get("quarterly"))
+            or bool(financials_chart.get("yearly"))
+            or "currentQuarterEstimate" in earnings_chart
+            or bool(earnings_chart.get("earningsDate"))
+        )
+        if not has_any:
+            return pd.DataFrame(
+                {col: pd.Series(dtype=dtype) for col, dtype in _EARNINGS_DTYPES.items()}
+            )
 
-        # EPS rows (only include actual/estimate)
-        for row in earnings_chart.get("quarterly", []):
-            records.append(
-                {
-                    "ticker": ticker,
-                    "date": row.get("date"),
-                    "type": "eps",
-                    "actual": row.get("actual"),
-                    "estimate": row.get("estimate"),
-                    "currency": currency,
-                    "max_age": max_age,
-                    "current_quarter_estimate": None,
-                    "current_quarter_estimate_date": None,
-                    "current_quarter_estimate_year": None,
-                    "earnings_date": None,
-                    "is_earnings_date_estimate": None,
-                    "revenue": None,
-                    "earnings": None,
-                }
+        # Built column-wise (one list per column) rather than one dict per row
+        columns = {col: [] for col in _EARNINGS_COLUMNS}
+
+        def extend(n: int, **values: list) -> None:
+            """Append n rows; columns not given are padded with None."""
+            values.update(
+                ticker=[ticker] * n, currency=[currency] * n, max_age=[max_age] * n
             )
+            for col, column in columns.items():
+                column.extend(values.get(col, [None] * n))
+
+        # EPS rows (only include actual/estimate)
+        eps_rows = earnings_chart.get("quarterly", [])
+        extend(
+            len(eps_rows),
+            date=[row.get("date") for row in eps_rows],
+            type=["eps"] * len(eps_rows),
+            actual=[row.get("actual") for row in eps_rows],
+            estimate=[row.get("estimate") for row in eps_rows],
+        )
 
         # Financials rows (quarterly/yearly, only revenue/earnings)
-        for period, ptype in [("quarterly", "quarterly"), ("yearly", "yearly")]:
-            for row in financials_chart.get(period, []):
-                records.append(
-                    {
-                        "ticker": ticker,
-                        "date": str(row.get("date")),
-                        "type": ptype,
-                        "actual": None,
-                        "estimate": None,
-                        "currency": currency,
-                        "max_age": max_age,
-                        "current_quarter_estimate": None,
-                        "current_quarter_estimate_date": None,
-                        "current_quarter_estimate_year": None,
-                        "earnings_date": None,
-                        "is_earnings_date_estimate": None,
-                        "revenue": row.get("revenue"),
-                        "earnings": row.get("earnings"),
-                    }
-                )
+        for period in ("quarterly", "yearly"):
+            rows = financials_chart.get(period, [])
+            extend(
+                len(rows),
+                date=[str(row.get("date")) for row in rows],
+                type=[period] * len(rows),
+                revenue=[row.get("revenue") for row in rows],
+                earnings=[row.get("earnings") for row in rows],
+            )
 
         # Current quarter estimate row
         if "currentQuarterEstimate" in earnings_chart:
-            records.append(
-                {
-                    "ticker": ticker,
-                    "date": earnings_chart.get("currentQuarterEstimateDate"),
-                    "type": "current_quarter_estimate",
-                    "actual": earnings_chart.get("currentQuarterEstimate"),
-                    "estimate": None,
-                    "currency": currency,
-                    "max_age": max_age,
-                    "current_quarter_estimate": earnings_chart.get(
-                        "currentQuarterEstimate"
-                    ),
-                    "current_quarter_estimate_date": earnings_chart.get(
-                        "currentQuarterEstimateDate"
-                    ),
-                    "current_quarter_estimate_year": earnings_chart.get(
-                        "currentQuarterEstimateYear"
-                    ),
-                    "earnings_date": None,
-                    "is_earnings_date_estimate": None,
-                    "revenue": None,
-                    "earnings": None,
-                }
+            estimate = earnings_chart.get("currentQuarterEstimate")
+            estimate_date = earnings_chart.get("currentQuarterEstimateDate")
+            extend(
+                1,
+                date=[estimate_date],
+                type=["current_quarter_estimate"],
+                actual=[estimate],
+                current_quarter_estimate=[estimate],
+                current_quarter_estimate_date=[estimate_date],
+                current_quarter_estimate_year=[
+                    earnings_chart.get("currentQuarterEstimateYear")
+                ],
             )
 
         # Earnings date rows (metadata)
-        for e_date in earnings_chart.get("earningsDate", []):
-            records.append(
-                {
-                    "ticker": ticker,
-                    "date": e_date,
-                    "type": "earnings_date",
-                    "actual": None,
-                    "estimate": None,
-                    "currency": currency,
-                    "max_age": max_age,
-                    "current_quarter_estimate": None,
-                    "current_quarter_estimate_date": None,
-                    "current_quarter_estimate_year": None,
-                    "earnings_date": e_date,
-                    "is_earnings_date_estimate": earnings_chart.get(
-                        "isEarningsDateEstimate"
-                    ),
-                    "revenue": None,
-                    "earnings": None,
-                }
-            )
+        earnings_dates = earnings_chart.get("earningsDate", [])
+        extend(
+            len(earnings_dates),
+            date=list(earnings_dates),
+            type=["earnings_date"] * len(earnings_dates),
+            earnings_date=list(earnings_dates),
+            is_earnings_date_estimate=[earnings_chart.get("isEarningsDateEstimate")]
+            * len(earnings_dates),
+        )
 
-        return pd.DataFrame.from_records(records)
+        return pd.DataFrame(columns, columns=_EARNINGS_COLUMNS, copy=False)
 
     def get_records(self, context):
         """Yield earnings records for a given context."""
         ticker = self._get_ticker_from_context(context)
         df = self._fetch_earnings(ticker)
-        df = fix_empty_values(df)
+        self._finish_partition(ticker)
         df.columns = clean_strings(df.columns)
-        yield from df.to_dict("records")
+        df = fix_empty_values(df, inplace=True)
+        yield from iter_records(df)
 
 
 class EarningsHistoryStream(YahooQueryStream):
@@ -659,29 +1084,32 @@ class EarningsHistoryStream(YahooQueryStream):
         "stock_tickers",
         "private_companies_tickers",
     ]
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("quarter", th.StringType, required=True),
-        th.Property("max_age", th.NumberType),
-        th.Property("eps_actual", th.NumberType),
-        th.Property("eps_estimate", th.NumberType),
-        th.Property("eps_difference", th.NumberType),
-        th.Property("surprise_percent", th.NumberType),
-        th.Property("currency", th.StringType),
-        th.Property("period", th.StringType),
-    ).to_dict()
+
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("quarter", th.StringType, required=True),
+            th.Property("max_age", th.NumberType),
+            th.Property("eps_actual", th.NumberType),
+            th.Property("eps_estimate", th.NumberType),
+            th.Property("eps_difference", th.NumberType),
+            th.Property("surprise_percent", th.NumberType),
+            th.Property("currency", th.StringType),
+            th.Property("period", th.StringType),
+        ).to_dict()
 
     def _fetch_earnings_history(self, ticker: str):
         """Fetch earnings history."""
-        df = self._fetch_with_crumb_retry(ticker, "earning_history", is_callable=False)
-        df = fix_empty_values(df)
+        df = self._fetch_data(ticker, "earning_history", is_callable=False)
         df.columns = clean_strings(df.columns)
+        df = fix_empty_values(df, inplace=True)
         return df
 
     def get_records(self, context):
         ticker = self._get_ticker_from_context(context)
         df = self._fetch_earnings_history(ticker)
-        yield from df.to_dict("records")
+        yield from iter_records(df)
 
 
 class EarningsTrendStream(YahooQueryStream):
@@ -689,107 +1117,81 @@ class EarningsTrendStream(YahooQueryStream):
 
     name = "earnings_trend"
     primary_keys = ["ticker", "period", "end_date"]
+    _quote_summary_module = "earningsTrend"
     _valid_segments = [
         "stock_tickers",
         "private_companies_tickers",
     ]
-    schema = th.PropertiesList(
-        th.Property("ticker", th.StringType, required=True),
-        th.Property("period", th.StringType, required=True),
-        th.Property("end_date", th.StringType),
-        th.Property("growth", th.AnyType()),
-        th.Property("earnings_avg", th.AnyType()),
-        th.Property("earnings_low", th.AnyType()),
-        th.Property("earnings_high", th.AnyType()),
-        th.Property("earnings_year_ago_eps", th.AnyType()),
-        th.Property("earnings_num_analysts", th.AnyType()),
-        th.Property("earnings_growth", th.AnyType()),
-        th.Property("earnings_currency", th.StringType),
-        th.Property("revenue_avg", th.AnyType()),
-        th.Property("revenue_low", th.AnyType()),
-        th.Property("revenue_high", th.AnyType()),
-        th.Property("revenue_num_analysts", th.AnyType()),
-        th.Property("revenue_year_ago", th.AnyType()),
-        th.Property("revenue_growth", th.AnyType()),
-        th.Property("revenue_currency", th.StringType),
-        th.Property("eps_trend_current", th.AnyType()),
-        th.Property("eps_trend_7days_ago", th.AnyType()),
-        th.Property("eps_trend_30days_ago", th.AnyType()),
-        th.Property("eps_trend_60days_ago", th.AnyType()),
-        th.Property("eps_trend_90days_ago", th.AnyType()),
-        th.Property("eps_trend_currency", th.StringType),
-        th.Property("eps_up_last_7days", th.AnyType()),
-        th.Property("eps_up_last_30days", th.AnyType()),
-        th.Property("eps_down_last_7days", th.AnyType()),
-        th.Property("eps_down_last_30days", th.AnyType()),
-        th.Property("eps_down_last_90days", th.ObjectType()),
-        th.Property("eps_revisions_currency", th.StringType),
-    ).to_dict()
+
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList(
+            th.Property("ticker", th.StringType, required=True),
+            th.Property("period", th.StringType, required=True),
+            th.Property("end_date", th.StringType),
+            th.Property("growth", th.AnyType()),
+            th.Property("earnings_avg", th.AnyType()),
+            th.Property("earnings_low", th.AnyType()),
+            th.Property("earnings_high", th.AnyType()),
+            th.Property("earnings_year_ago_eps", th.AnyType()),
+            th.Property("earnings_num_analysts", th.AnyType()),
+            th.Property("earnings_growth", th.AnyType()),
+            th.Property("earnings_currency", th.StringType),
+            th.Property("revenue_avg", th.AnyType()),
+            th.Property("revenue_low", th.AnyType()),
+            th.Property("revenue_high", th.AnyType()),
+            th.Property("revenue_num_analysts", th.AnyType()),
+            th.Property("revenue_year_ago", th.AnyType()),
+            th.Property("revenue_growth", th.AnyType()),
+            th.Property("revenue_currency", th.StringType),
+            th.Property("eps_trend_current", th.AnyType()),
+            th.Property("eps_trend_7days_ago", th.AnyType()),
+            th.Property("eps_trend_30days_ago", th.AnyType()),
+            th.Property("eps_trend_60days_ago", th.AnyType()),
+            th.Property("eps_trend_90days_ago", th.AnyType()),
+            th.Property("eps_trend_currency", th.StringType),
+            th.Property("eps_up_last_7days", th.AnyType()),
+            th.Property("eps_up_last_30days", th.AnyType()),
+            th.Property("eps_down_last_7days", th.AnyType()),
+            th.Property("eps_down_last_30days", th.AnyType()),
+            th.Property("eps_down_last_90days", th.ObjectType()),
+            th.Property("eps_revisions_currency", th.StringType),
+        ).to_dict()
+
+    @functools.cached_property
+    def _selected_trend_fields(self) -> dict[str, tuple[str, ...]]:
+        """The part of _EARNINGS_TREND_FIELDS whose columns are selected in the catalog."""
+        return {
+            column: path
+            for column, path in _EARNINGS_TREND_FIELDS.items()
+            if self.mask.get(("properties", column), True)
+        }
 
     def _fetch_earnings_trend(self, ticker: str):
         """Fetch earnings trend data."""
-        data = self._fetch_with_crumb_retry(ticker, "earnings_trend", is_callable=False)
-        records = []
-        for ticker, ticker_data in data.items():
-            for trend in ticker_data["trend"]:
-                record = {
-                    "symbol": ticker,
-                    "period": trend["period"],
-                    "end_date": trend["endDate"],
-                    "growth": trend["growth"],
-                    # Earnings Estimate
-                    "earnings_avg": trend["earningsEstimate"].get("avg"),
-                    "earnings_low": trend["earningsEstimate"].get("low"),
-                    "earnings_high": trend["earningsEstimate"].get("high"),
-                    "earnings_year_ago_eps": trend["earningsEstimate"].get(
-                        "yearAgoEps"
-                    ),
-                    "earnings_num_analysts": trend["earningsEstimate"].get(
-                        "numberOfAnalysts"
-                    ),
-                    "earnings_growth": trend["earningsEstimate"].get("growth"),
-                    "earnings_currency": trend["earningsEstimate"].get(
-                        "earningsCurrency"
-                    ),
-                    # Revenue Estimate
-                    "revenue_avg": trend["revenueEstimate"].get("avg"),
-                    "revenue_low": trend["revenueEstimate"].get("low"),
-                    "revenue_high": trend["revenueEstimate"].get("high"),
-                    "revenue_num_analysts": trend["revenueEstimate"].get(
-                        "numberOfAnalysts"
-                    ),
-                    "revenue_year_ago": trend["revenueEstimate"].get("yearAgoRevenue"),
-                    "revenue_growth": trend["revenueEstimate"].get("growth"),
-                    "revenue_currency": trend["revenueEstimate"].get("revenueCurrency"),
-                    # EPS Trend
-                    "eps_trend_current": trend["epsTrend"].get("current"),
-                    "eps_trend_7days_ago": trend["epsTrend"].get("7daysAgo"),
-                    "eps_trend_30days_ago": trend["epsTrend"].get("30daysAgo"),
-                    "eps_trend_60days_ago": trend["epsTrend"].get("60daysAgo"),
-                    "eps_trend_90days_ago": trend["epsTrend"].get("90daysAgo"),
-                    "eps_trend_currency": trend["epsTrend"].get("epsTrendCurrency"),
-                    # EPS Revisions
-                    "eps_up_last_7days": trend["epsRevisions"].get("upLast7days"),
-                    "eps_up_last_30days": trend["epsRevisions"].get("upLast30days"),
-                    "eps_down_last_7days": trend["epsRevisions"].get("downLast7Days"),
-                    "eps_down_last_30days": trend["epsRevisions"].get("downLast30days"),
-                    "eps_down_last_90days": trend["epsRevisions"].get("downLast90days"),
-                    "eps_revisions_currency": trend["epsRevisions"].get(
-                        "epsRevisionsCurrency"
-                    ),
-                }
-                records.append(record)
-        df = fix_empty_values(pd.DataFrame(records))
-        df = df.rename(columns={"symbol": "ticker"})
-        if "end_date" not in df.columns:
-            df["end_date"] = None
-        df.columns = clean_strings(df.columns)
+        data = self._fetch_data(ticker, "earnings_trend", is_callable=False)
+        trends = [
+            (symbol, trend)
+            for symbol, ticker_data in data.items()
+            for trend in ticker_data["trend"]
+        ]
+        if not trends:
+            return pd.DataFrame(columns=self.expected_columns)
+
+        # Built column-wise (one list per column) rather than one dict per row; the
+        # field spec already names columns in snake_case, so no clean_strings pass
+        build = trend_columns_builder(tuple(self._selected_trend_fields.items()))
+        df = pd.DataFrame(build(trends), copy=False)
+        df = fix_empty_values(df, inplace=True)
+        if self.config.get("arrow_dtypes", False):
+            df = to_arrow_dtypes(df)
         return df
 
     def get_records(self, context):
         ticker = self._get_ticker_from_context(context)
         df = self._fetch_earnings_trend(ticker)
-        yield from df.to_dict("records")
+        self._finish_partition(ticker)
+        yield from iter_records(df)
 
 
 class NewsStream(BaseFinancialStream):
@@ -797,7 +1199,10 @@ class NewsStream(BaseFinancialStream):
 
     name = "news"
     primary_keys = ["ticker", "date", "news"]
-    schema = th.PropertiesList().to_dict()
+
+    @lazy_schema
+    def schema() -> dict:
+        return th.PropertiesList().to_dict()
 
     def get_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get news articles records."""
@@ -808,4 +1213,4 @@ class NewsStream(BaseFinancialStream):
         self.logger.info(f"Processing news for ticker: {ticker}")
         df = self._fetch_with_crumb_retry(ticker, "news")
         df = fix_empty_values(df)
-        yield from df.to_dict("records")
+        yield from iter_records(df)
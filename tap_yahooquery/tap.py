@@ -5,7 +5,15 @@ from __future__ import annotations
 from singer_sdk import Tap
 from singer_sdk import typing as th
 
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 import typing as t
+import yahooquery as yq
+from curl_cffi.requests import RetryStrategy
+from requests_futures.sessions import FuturesSession
+from yahooquery.session_management import initialize_session
 from tap_yahooquery.streams import (
     TickersStream,
     SecFilingsStream,
@@ -22,6 +30,9 @@ from tap_yahooquery.streams import (
     # NewsStream,
 )
 
+# memoized yq.Ticker objects kept per tap; the least recently used are dropped past this
+MAX_CACHED_TICKER_OBJS = 1024
+
 
 class TapYahooQuery(Tap):
     """YahooQuery tap class."""
@@ -31,6 +42,21 @@ class TapYahooQuery(Tap):
     _cached_tickers: t.List[dict] | None = None
     _tickers_stream_instance: TickersStream | None = None
 
+    def __init__(self, *args, **kwargs) -> None:
+        self._ticker_session_cache: OrderedDict[tuple[str, bool], yq.Ticker] = (
+            OrderedDict()
+        )
+        self._shared_session = None
+        self._shared_async_session = None
+        self._ticker_session_lock = threading.Lock()
+        self._combined_modules: dict[str, dict[str, dict]] = {}
+        self._combined_modules_lock = threading.Lock()
+        self._combined_streams_done: set[str] = set()
+        self._discovered_streams: list | None = None
+        self._cross_stream_futures: dict[tuple[str, str], Future] = {}
+        self._cross_stream_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
     config_jsonschema = th.PropertiesList(
         th.Property(
             "start_date",
@@ -48,10 +74,130 @@ class TapYahooQuery(Tap):
             description="Ticker configuration including selection and query params",
             required=True,
         ),
+        th.Property(
+            "async_fetch",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Prefetch quoteSummary endpoints for all tickers with aiohttp, reusing the "
+                "shared session's crumb and cookies. aiohttp cannot impersonate a "
+                "browser's TLS fingerprint the way the curl_cffi session does; tickers "
+                "whose requests Yahoo rejects fall back to the synchronous fetch."
+            ),
+        ),
+        th.Property(
+            "async_concurrency",
+            th.IntegerType,
+            default=50,
+            description="Maximum in-flight requests when async_fetch is enabled",
+        ),
+        th.Property(
+            "async_max_tries",
+            th.IntegerType,
+            default=5,
+            description=(
+                "Attempts per ticker on the async_fetch path before falling back "
+                "to the synchronous fetch"
+            ),
+        ),
+        th.Property(
+            "http_retries",
+            th.IntegerType,
+            default=3,
+            description=(
+                "Transport-level retries (connection resets, timeouts) with exponential "
+                "backoff on the shared Yahoo session, before yahoo_api_retry takes over"
+            ),
+        ),
+        th.Property(
+            "fetch_batch_size",
+            th.IntegerType,
+            default=1,
+            description=(
+                "Number of tickers requested through one multi-symbol yahooquery "
+                "Ticker, capped at 99 (1 fetches each ticker separately)"
+            ),
+        ),
+        th.Property(
+            "fetch_concurrency",
+            th.IntegerType,
+            default=8,
+            description=(
+                "Number of upcoming ticker partitions fetched ahead on the shared "
+                "fetch pool, sized by the TAP_YQ_WORKERS env var (1 disables prefetching)"
+            ),
+        ),
+        th.Property(
+            "cache_enabled",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Cache Yahoo responses on disk with per-endpoint TTLs "
+                "(e.g. 90 days for financials, 1 hour for news)"
+            ),
+        ),
+        th.Property(
+            "cache_ttl_seconds",
+            th.IntegerType,
+            description=(
+                "Cache Yahoo responses on disk for this many seconds, overriding the "
+                "per-endpoint TTLs (unset with cache_enabled off disables the cache)"
+            ),
+        ),
+        th.Property(
+            "cache_dir",
+            th.StringType,
+            default="~/.tap-yahooquery/cache",
+            description="Directory for the on-disk response cache",
+        ),
+        th.Property(
+            "normalize_in_processes",
+            th.BooleanType,
+            default=False,
+            description="Run DataFrame normalization in a process pool (one worker per CPU)",
+        ),
+        th.Property(
+            "arrow_dtypes",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Hold sec_filings and earnings_trend frames in pyarrow-backed dtypes "
+                "until their records are emitted. Requires the `arrow` extra."
+            ),
+        ),
+        th.Property(
+            "prefetch_across_streams",
+            th.BooleanType,
+            default=False,
+            description=(
+                "As a stream reaches its last fetch_concurrency tickers, start the "
+                "next selected stream's first tickers in the freed fetch slots, so "
+                "streams overlap. At most one window waits in memory for that stream."
+            ),
+        ),
+        th.Property(
+            "combine_quote_summary_modules",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Fetch the quoteSummary modules of every selected stream (sec_filings, "
+                "calendar_events, earnings, earnings_trend) in one request per ticker. "
+                "Modules for streams that have not run yet are held in memory until they do."
+            ),
+        ),
         th.Property(
             "sec_filings",
             th.ObjectType(
                 th.Property("use_cached_tickers", th.BooleanType),
+                th.Property("cache_ttl", th.IntegerType),
+                th.Property(
+                    "use_dataframe",
+                    th.BooleanType,
+                    description=(
+                        "Build records through yahooquery's sec_filings DataFrame "
+                        "instead of straight from the secFilings JSON"
+                    ),
+                ),
             ),
             description="SEC filings stream configuration",
         ),
@@ -59,6 +205,7 @@ class TapYahooQuery(Tap):
             "income_stmt",
             th.ObjectType(
                 th.Property("use_cached_tickers", th.BooleanType),
+                th.Property("cache_ttl", th.IntegerType),
             ),
             description="Income Statement stream configuration",
         ),
@@ -66,9 +213,35 @@ class TapYahooQuery(Tap):
             "all_financial_data",
             th.ObjectType(
                 th.Property("use_cached_tickers", th.BooleanType),
+                th.Property("cache_ttl", th.IntegerType),
             ),
             description="All Financial Data stream configuration",
         ),
+        th.Property(
+            "company_officers",
+            th.ObjectType(
+                th.Property("use_cached_tickers", th.BooleanType),
+                th.Property("cache_ttl", th.IntegerType),
+                th.Property(
+                    "surrogate_key_hash",
+                    th.StringType,
+                    allowed_values=["uuid5", "blake2b"],
+                    description=(
+                        "Hash used for surrogate_key. blake2b is faster but produces "
+                        "different keys than uuid5, a one-time key rotation downstream."
+                    ),
+                ),
+            ),
+            description="Company Officers stream configuration",
+        ),
+        th.Property(
+            "earnings_trend",
+            th.ObjectType(
+                th.Property("use_cached_tickers", th.BooleanType),
+                th.Property("cache_ttl", th.IntegerType),
+            ),
+            description="Earnings Trend stream configuration",
+        ),
     ).to_dict()
 
     def get_cached_tickers(self) -> t.List[dict]:
@@ -79,30 +252,151 @@ class TapYahooQuery(Tap):
             self.logger.info(f"Cached {len(self._cached_tickers)} tickers.")
         return self._cached_tickers
 
+    def _get_shared_session(self, asynchronous: bool = False):
+        """One yahooquery session (consent handshake and cookies) shared by every Ticker."""
+        if self._shared_session is None:
+            # curl keeps the connection pool alive across requests; retrying dropped
+            # connections in curl is far cheaper than a fresh Ticker and crumb
+            self._shared_session = initialize_session(
+                retry=RetryStrategy(
+                    count=self.config.get("http_retries", 3),
+                    delay=0.5,
+                    jitter=0.5,
+                    backoff="exponential",
+                )
+            )
+        if not asynchronous:
+            return self._shared_session
+        if self._shared_async_session is None:
+            # yahooquery switches to concurrent requests when its session is a FuturesSession
+            self._shared_async_session = FuturesSession(session=self._shared_session)
+        return self._shared_async_session
+
+    def get_ticker_obj(self, ticker: str, asynchronous: bool = False) -> yq.Ticker:
+        """Memoized yq.Ticker on the shared session, so each ticker fetches its crumb once."""
+        key = (ticker, asynchronous)
+        with self._ticker_session_lock:
+            ticker_obj = self._ticker_session_cache.get(key)
+            if ticker_obj is not None:
+                self._ticker_session_cache.move_to_end(key)
+                return ticker_obj
+            session = self._get_shared_session(asynchronous)
+            cache = self._ticker_session_cache
+
+        # yq.Ticker fetches its crumb on construction, so build it without holding the
+        # lock; a concurrent build of the same key just loses the race below
+        ticker_obj = yq.Ticker(ticker, session=session)
+        with self._ticker_session_lock:
+            ticker_obj = cache.setdefault(key, ticker_obj)
+            cache.move_to_end(key)
+            while len(cache) > MAX_CACHED_TICKER_OBJS:
+                cache.popitem(last=False)
+        return ticker_obj
+
+    def reset_ticker_sessions(self) -> None:
+        """Drop the shared session and memoized Tickers, e.g. after an invalid crumb."""
+        # Other threads may still be mid-request on the old session, so it is not
+        # closed here; it is released once their Ticker objects go out of scope.
+        with self._ticker_session_lock:
+            self._shared_session = None
+            self._shared_async_session = None
+            self._ticker_session_cache = OrderedDict()
+
     def get_tickers_stream(self) -> TickersStream:
         if self._tickers_stream_instance is None:
             self.logger.info("Creating TickersStream instance...")
             self._tickers_stream_instance = TickersStream(self)
         return self._tickers_stream_instance
 
-    def discover_streams(self) -> list:
-        """Return a list of discovered streams."""
+    @functools.cached_property
+    def combined_quote_summary_streams(self) -> list:
+        """Selected streams whose quoteSummary module is fetched together per ticker."""
         return [
-            TickersStream(self),
-            SecFilingsStream(self),
-            IncomeStmtStream(self),
-            AllFinancialDataStream(self),
-            CorporateEventsStream(self),
-            CalendarEventsStream(self),
-            DividendHistoryStream(self),
-            CorporateGuidanceStream(self),
-            CompanyOfficersStream(self),
-            EarningsHistoryStream(self),
-            EarningsTrendStream(self),
-            EarningsStream(self),
-            # NewsStream(self),
+            stream
+            for stream in self.streams.values()
+            if stream.selected and stream._quote_summary_module
         ]
 
+    def get_combined_module(self, stream, ticker: str) -> dict | None:
+        """
+        Return stream's quoteSummary module for ticker as {ticker: data}, fetching the
+        modules of every combined stream that will still sync ticker on first use. None
+        when Yahoo did not return it or no other stream shares the request, so stream
+        fetches it alone. A ticker's entry is dropped once each module is taken.
+        """
+        with self._combined_modules_lock:
+            modules_data = self._combined_modules.get(ticker)
+            done = set(self._combined_streams_done)
+
+        if modules_data is None:
+            # streams that finished syncing or whose segment rules skip ticker would
+            # never take their module
+            segment = (stream._all_tickers or {}).get(ticker, {}).get("segment")
+            modules = [
+                combined._quote_summary_module
+                for combined in self.combined_quote_summary_streams
+                if combined is stream
+                or (
+                    combined.name not in done
+                    and (
+                        combined._valid_segments is None
+                        or segment in combined._valid_segments
+                    )
+                )
+            ]
+            # yahooquery unwraps single-module responses; nothing to share anyway
+            if len(modules) < 2:
+                return None
+
+            data = stream._fetch_with_crumb_retry(
+                ticker, "get_modules", endpoint="quote_summary_modules", modules=modules
+            )
+            ticker_data = data.get(ticker) if isinstance(data, dict) else None
+            if not isinstance(ticker_data, dict):
+                ticker_data = {}
+            # modules Yahoo left out are kept as None so their streams fetch them alone
+            fetched = {
+                module: {ticker: ticker_data[module]} if module in ticker_data else None
+                for module in modules
+            }
+            with self._combined_modules_lock:
+                modules_data = self._combined_modules.setdefault(ticker, fetched)
+
+        with self._combined_modules_lock:
+            data = modules_data.pop(stream._quote_summary_module, None)
+            if not modules_data and self._combined_modules.get(ticker) is modules_data:
+                del self._combined_modules[ticker]
+            return data
+
+    def drop_combined_modules(self, stream) -> None:
+        """Drop the modules fetched for stream that its sync never took."""
+        with self._combined_modules_lock:
+            self._combined_streams_done.add(stream.name)
+            for ticker, modules_data in list(self._combined_modules.items()):
+                modules_data.pop(stream._quote_summary_module, None)
+                if not modules_data:
+                    del self._combined_modules[ticker]
+
+    def discover_streams(self) -> list:
+        """Return a list of discovered streams, built once per tap instance."""
+        if self._discovered_streams is None:
+            self._discovered_streams = [
+                TickersStream(self),
+                SecFilingsStream(self),
+                IncomeStmtStream(self),
+                AllFinancialDataStream(self),
+                CorporateEventsStream(self),
+                CalendarEventsStream(self),
+                DividendHistoryStream(self),
+                CorporateGuidanceStream(self),
+                CompanyOfficersStream(self),
+                EarningsHistoryStream(self),
+                EarningsTrendStream(self),
+                EarningsStream(self),
+                # NewsStream(self),
+            ]
+        return self._discovered_streams
+
 
 if __name__ == "__main__":
     TapYahooQuery.cli()
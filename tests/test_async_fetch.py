@@ -0,0 +1,185 @@
+"""Tests for the aiohttp quoteSummary fan-out."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import yahooquery as yq
+
+import tap_yahooquery.helpers as helpers
+from tap_yahooquery.tap import TapYahooQuery
+
+pytest.importorskip("aiohttp")
+
+RealTicker = yq.Ticker
+CALENDAR = {"maxAge": 1, "earnings": {"earningsAverage": 2.1}}
+
+
+class FakeCookie:
+    name = "A3"
+    value = "shared-cookie"
+
+
+class FakeSession:
+    headers = {"User-Agent": "shared-agent"}
+
+    class cookies:
+        jar = [FakeCookie()]
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def shared_ticker():
+    """yq.Ticker as get_ticker_obj builds it, without the network handshake."""
+    ticker = RealTicker.__new__(RealTicker)
+    ticker._country_params = {"lang": "en-US", "region": "US"}
+    ticker.crumb = "shared-crumb"
+    ticker.session = FakeSession()
+    ticker.formatted = False
+    return ticker
+
+
+@pytest.fixture
+def gathered(monkeypatch):
+    """Stub the event loop fan-out, recording what each request would send."""
+    monkeypatch.setattr(helpers.time, "sleep", lambda seconds: None)
+    calls = []
+
+    async def gather(tickers, params, headers, cookies, concurrency, max_tries):
+        calls.append(
+            {
+                "tickers": list(tickers),
+                "params": params,
+                "headers": headers,
+                "cookies": cookies,
+            }
+        )
+        return [
+            {"quoteSummary": {"result": [{"calendarEvents": CALENDAR}], "error": None}}
+            for _ in tickers
+        ]
+
+    monkeypatch.setattr(helpers, "_gather_quote_summaries", gather)
+    monkeypatch.setattr(
+        helpers.yq, "Ticker", lambda *args, **kwargs: pytest.fail("built a new Ticker")
+    )
+    return calls
+
+
+def test_async_fetch_many_reuses_shared_crumb_and_cookies(gathered):
+    handshake = shared_ticker()
+
+    data = helpers.async_fetch_many(
+        ["AAPL", "MSFT"], "calendar_events", handshake=handshake
+    )
+
+    assert data == {"AAPL": CALENDAR, "MSFT": CALENDAR}
+    (call,) = gathered
+    assert call["params"]["crumb"] == "shared-crumb"
+    assert call["params"]["modules"] == "calendarEvents"
+    assert call["cookies"] == {"A3": "shared-cookie"}
+    assert call["headers"] == {"User-Agent": "shared-agent"}
+    # the shared session keeps serving the synchronous path
+    assert not handshake.session.closed
+
+
+def make_stream(monkeypatch, tmp_path, get_ticker_obj=shared_ticker):
+    tap = TapYahooQuery(
+        config={
+            "tickers": {"select_tickers": ["AAPL"]},
+            "async_fetch": True,
+            "cache_enabled": True,
+            "cache_dir": str(tmp_path),
+        },
+        parse_env_config=False,
+    )
+    monkeypatch.setattr(
+        tap, "get_ticker_obj", lambda ticker, asynchronous=False: get_ticker_obj()
+    )
+    stream = tap.streams["calendar_events"]
+    stream._partition_tickers = ["AAPL", "MSFT"]
+    return stream
+
+
+def test_async_prefetch_is_shaped_like_the_sync_property_and_cached(
+    gathered, monkeypatch, tmp_path
+):
+    stream = make_stream(monkeypatch, tmp_path)
+
+    assert stream._fetch_data("AAPL", "calendar_events", is_callable=False) == {
+        "AAPL": CALENDAR
+    }
+    assert gathered[0]["tickers"] == ["AAPL", "MSFT"]
+
+    # a later run serves both tickers from the FileCache without the fan-out
+    stream = make_stream(
+        monkeypatch, tmp_path, lambda: pytest.fail("fetched a cached ticker")
+    )
+    assert stream._fetch_data("MSFT", "calendar_events", is_callable=False) == {
+        "MSFT": CALENDAR
+    }
+    assert len(gathered) == 1
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        request_info = SimpleNamespace(real_url=helpers.QUOTE_SUMMARY_URL)
+        raise helpers.aiohttp.ClientResponseError(request_info, (), status=self.status)
+
+    async def json(self, content_type=None):
+        return {"quoteSummary": {"result": [{"calendarEvents": CALENDAR}]}}
+
+
+class FakeClientSession:
+    """Serves queued statuses, raising the exceptions in place of a response."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.requests = 0
+
+    def get(self, url, params=None):
+        self.requests += 1
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return FakeResponse(status)
+
+
+def fetch_quote_summary(session, max_tries, monkeypatch):
+    monkeypatch.setattr(helpers.random, "uniform", lambda low, high: 0)
+    return asyncio.run(
+        helpers._fetch_quote_summary(
+            session, asyncio.Semaphore(1), "AAPL", {}, max_tries=max_tries
+        )
+    )
+
+
+def test_quote_summary_retries_rate_limits_server_and_network_errors(monkeypatch):
+    session = FakeClientSession(
+        [429, 503, helpers.aiohttp.ClientConnectionError("reset"), 200]
+    )
+
+    response = fetch_quote_summary(session, 5, monkeypatch)
+
+    assert response["quoteSummary"]["result"][0]["calendarEvents"] == CALENDAR
+    assert session.requests == 4
+
+
+def test_quote_summary_raises_after_max_tries(monkeypatch):
+    session = FakeClientSession([503, 503, 503, 200])
+
+    with pytest.raises(helpers.aiohttp.ClientResponseError):
+        fetch_quote_summary(session, 3, monkeypatch)
+    assert session.requests == 3
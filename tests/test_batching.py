@@ -0,0 +1,196 @@
+"""Tests for splitting multi-symbol batches back into per-ticker responses."""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from tap_yahooquery.client import YahooQueryStream
+from tap_yahooquery.tap import TapYahooQuery
+
+MODULES = {
+    "assetProfile": {
+        "AAPL": {"companyOfficers": [{"name": "Tim Cook", "title": "CEO"}]},
+        "BAD": "Quote not found for ticker symbol: BAD",
+        "MSFT": {
+            "companyOfficers": [
+                {"name": "Satya Nadella", "title": "CEO"},
+                {"name": "Amy Hood", "title": "CFO"},
+            ]
+        },
+    },
+    "earningsHistory": {
+        "AAPL": {"history": [{"quarter": "2024-06-30", "epsActual": 1.4}]},
+        "BAD": "Quote not found for ticker symbol: BAD",
+        "MSFT": {"history": [{"quarter": "2024-06-30", "epsActual": 2.95}]},
+    },
+}
+
+
+class FakeTicker:
+    """Stand-in for yq.Ticker serving canned get_modules responses."""
+
+    def __init__(self, symbols: str) -> None:
+        self.symbols = symbols.split()
+
+    def get_modules(self, modules):
+        return {symbol: MODULES[modules][symbol] for symbol in self.symbols}
+
+
+@pytest.fixture
+def tap(monkeypatch):
+    monkeypatch.setattr("tap_yahooquery.helpers.time.sleep", lambda seconds: None)
+    tap = TapYahooQuery(
+        config={"tickers": {"select_tickers": ["AAPL"]}, "fetch_batch_size": 3},
+        parse_env_config=False,
+    )
+    monkeypatch.setattr(
+        tap, "get_ticker_obj", lambda ticker, asynchronous=False: FakeTicker(ticker)
+    )
+    return tap
+
+
+def test_errored_symbol_does_not_shift_batch_rows(tap):
+    stream = tap.streams["company_officers"]
+    stream._partition_tickers = ["AAPL", "BAD", "MSFT"]
+
+    aapl = stream._get_batched("AAPL", "company_officers", is_callable=False)
+    bad = stream._get_batched("BAD", "company_officers", is_callable=False)
+    msft = stream._get_batched("MSFT", "company_officers", is_callable=False)
+
+    assert aapl.index.get_level_values(0).unique().tolist() == ["AAPL"]
+    assert aapl["name"].tolist() == ["Tim Cook"]
+    assert msft.index.get_level_values(0).unique().tolist() == ["MSFT"]
+    assert msft["name"].tolist() == ["Satya Nadella", "Amy Hood"]
+    # falls back to its own request instead of inheriting a neighbour's rows
+    assert bad is None
+
+
+def test_earning_history_batch_with_errored_symbol(tap):
+    stream = tap.streams["earnings_history"]
+    stream._partition_tickers = ["BAD", "AAPL", "MSFT"]
+
+    bad = stream._get_batched("BAD", "earning_history", is_callable=False)
+    aapl = stream._get_batched("AAPL", "earning_history", is_callable=False)
+    msft = stream._get_batched("MSFT", "earning_history", is_callable=False)
+
+    assert bad is None
+    assert aapl.index.get_level_values(0).unique().tolist() == ["AAPL"]
+    assert aapl["epsActual"].tolist() == [1.4]
+    assert msft["epsActual"].tolist() == [2.95]
+
+
+def test_split_by_symbol_uses_symbol_index_level():
+    df = pd.DataFrame(
+        {"value": [1, 2, 3]},
+        index=pd.MultiIndex.from_tuples(
+            [("MSFT", 0), ("AAPL", 0), ("AAPL", 1)], names=["symbol", "row"]
+        ),
+    )
+    split = YahooQueryStream._split_by_symbol(df, ["AAPL", "MSFT"])
+
+    assert split["AAPL"]["value"].tolist() == [2, 3]
+    assert split["MSFT"]["value"].tolist() == [1]
+
+
+def test_split_by_symbol_drops_raw_dict_for_frame_endpoints():
+    # yahooquery's _financials returns the raw payload when any symbol errored
+    data = {
+        "AAPL": [{"asOfDate": "2024-09-30", "reportedValue": 1.0}],
+        "BAD": "No fundamentals data found for any of the summaryTypes=...",
+    }
+    assert YahooQueryStream._split_by_symbol(data, ["AAPL", "BAD"]) == {}
+
+
+def test_split_by_symbol_keeps_per_symbol_dicts():
+    data = {"AAPL": {"trend": []}, "BAD": "Quote not found for ticker symbol: BAD"}
+    split = YahooQueryStream._split_by_symbol(data, ["AAPL", "BAD"], expect_frame=False)
+
+    assert split == {
+        "AAPL": {"AAPL": {"trend": []}},
+        "BAD": {"BAD": "Quote not found for ticker symbol: BAD"},
+    }
+
+
+def test_raw_sec_filings_batch_is_split_per_symbol(tap, monkeypatch):
+    calls = []
+    filings = {
+        "AAPL": {"filings": [{"date": "2024-11-01", "type": "10-K", "title": "NaN"}]},
+        "BAD": "Quote not found for ticker symbol: BAD",
+        "MSFT": {"filings": [{"date": "2024-10-30", "type": "10-Q"}]},
+    }
+
+    class SecTicker(FakeTicker):
+        def get_modules(self, modules):
+            calls.append(self.symbols)
+            return {symbol: filings[symbol] for symbol in self.symbols}
+
+    monkeypatch.setattr(
+        tap, "get_ticker_obj", lambda ticker, asynchronous=False: SecTicker(ticker)
+    )
+    stream = tap.streams["sec_filings"]
+    stream._partition_tickers = ["AAPL", "BAD", "MSFT"]
+
+    records = {
+        ticker: list(stream.get_records({"ticker": ticker}))
+        for ticker in stream._partition_tickers
+    }
+
+    # one batch request, handed out per symbol instead of refetched one by one
+    assert calls == [["AAPL", "BAD", "MSFT"]]
+    assert [r["type"] for r in records["AAPL"]] == ["10-K"]
+    assert [r["type"] for r in records["MSFT"]] == ["10-Q"]
+    assert records["BAD"] == []
+    # cleaned like the DataFrame path's fix_empty_values
+    assert records["AAPL"][0]["title"] is None
+
+
+def test_concurrent_batches_fetch_outside_the_lock(tap, monkeypatch):
+    stream = tap.streams["calendar_events"]
+    stream._partition_tickers = ["A", "B", "C", "D", "E", "F"]
+    first_batch_started = threading.Event()
+    release_first_batch = threading.Event()
+    calls = []
+
+    def fetch(symbols, method_name, **kwargs):
+        calls.append(symbols)
+        if symbols.startswith("A"):
+            first_batch_started.set()
+            # the second batch must be able to fetch while this one is in flight
+            assert release_first_batch.wait(5)
+        else:
+            release_first_batch.set()
+        return {symbol: {"symbol": symbol} for symbol in symbols.split()}
+
+    monkeypatch.setattr(stream, "_fetch_with_crumb_retry", fetch)
+    results = {}
+
+    def get(ticker):
+        results[ticker] = stream._get_batched(ticker, "calendar_events", False)
+
+    first = threading.Thread(target=get, args=("A",))
+    first.start()
+    assert first_batch_started.wait(5)
+    # D starts the next batch and completes while A's batch is still in flight
+    get("D")
+    first.join(5)
+    for ticker in "BCEF":
+        get(ticker)
+
+    assert sorted(calls) == ["A B C", "D E F"]
+    assert results == {t: {t: {"symbol": t}} for t in "ABCDEF"}
+
+
+def test_failed_batch_raises_for_its_fetcher_and_others_fetch_alone(tap, monkeypatch):
+    stream = tap.streams["calendar_events"]
+    stream._partition_tickers = ["A", "B", "C"]
+
+    def fetch(symbols, method_name, **kwargs):
+        raise ConnectionError("batch failed")
+
+    monkeypatch.setattr(stream, "_fetch_with_crumb_retry", fetch)
+
+    with pytest.raises(ConnectionError, match="batch failed"):
+        stream._get_batched("A", "calendar_events", False)
+    assert stream._get_batched("B", "calendar_events", False) is None
+    assert stream._get_batched("C", "calendar_events", False) is None
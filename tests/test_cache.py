@@ -0,0 +1,92 @@
+"""Tests for the on-disk response cache."""
+
+import pytest
+
+from tap_yahooquery import cache as cache_module
+from tap_yahooquery.cache import FileCache, cached
+
+
+class FakeStream:
+    """Minimal stand-in for a stream calling a @cached fetch."""
+
+    def __init__(self, cache_dir, responses):
+        self.config = {"cache_enabled": True, "cache_dir": str(cache_dir)}
+        self.responses = responses
+        self.calls = 0
+
+    def _get_stream_config(self):
+        return {}
+
+    @cached
+    def fetch(self, ticker, method_name, **kwargs):
+        self.calls += 1
+        return self.responses[ticker]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"AAPL": "Quote not found for ticker symbol: AAPL"},
+        {"AAPL": "No fundamentals data found for any of the summaryTypes=..."},
+        {"AAPL": {"maxAge": 1}, "BAD": "Quote not found for ticker symbol: BAD"},
+    ],
+)
+def test_per_symbol_error_strings_are_not_cached(tmp_path, response):
+    stream = FakeStream(tmp_path, {"AAPL": response})
+
+    assert stream.fetch("AAPL", "earnings") == response
+    assert stream.fetch("AAPL", "earnings") == response
+    assert stream.calls == 2
+
+
+def test_module_dicts_are_cached(tmp_path):
+    response = {"AAPL": {"earningsChart": {"quarterly": []}}}
+    stream = FakeStream(tmp_path, {"AAPL": response})
+
+    assert stream.fetch("AAPL", "earnings") == response
+    assert stream.fetch("AAPL", "earnings") == response
+    assert stream.calls == 1
+
+
+def test_file_cache_expires_after_ttl(tmp_path, monkeypatch):
+    file_cache = FileCache(str(tmp_path))
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    file_cache.set("earnings", "key", {"AAPL": {}}, ttl_seconds=60)
+
+    now += 59
+    assert file_cache.get("earnings", "key", ttl_seconds=60) == {"AAPL": {}}
+    now += 1
+    assert file_cache.get("earnings", "key", ttl_seconds=60) is None
+
+
+def test_file_cache_ignores_poisoned_entries(tmp_path):
+    file_cache = FileCache(str(tmp_path))
+    file_cache.set("earnings", "truncated", {"AAPL": {}}, ttl_seconds=60)
+    file_cache.set("earnings", "bad_meta", {"AAPL": {}}, ttl_seconds=60)
+    data_path, _ = file_cache._paths("earnings", "truncated")
+    with open(data_path, "wb") as f:
+        f.write(b"\x80\x04not a pickle")
+    _, meta_path = file_cache._paths("earnings", "bad_meta")
+    with open(meta_path, "w") as f:
+        f.write("{")
+
+    assert file_cache.get("earnings", "truncated", ttl_seconds=60) is None
+    assert file_cache.get("earnings", "bad_meta", ttl_seconds=60) is None
+    assert file_cache.get("earnings", "missing", ttl_seconds=60) is None
+
+
+def test_endpoint_picks_cache_bucket(tmp_path):
+    response = {"AAPL": {"filings": []}}
+    stream = FakeStream(tmp_path, {"AAPL": response})
+
+    stream.fetch("AAPL", "get_modules", endpoint="sec_filings", modules="secFilings")
+
+    assert [p.name for p in tmp_path.iterdir()] == ["sec_filings"]
+    assert (
+        stream.fetch(
+            "AAPL", "get_modules", endpoint="sec_filings", modules="secFilings"
+        )
+        == response
+    )
+    assert stream.calls == 1
@@ -0,0 +1,105 @@
+"""Tests for sharing one quoteSummary request between the combined streams."""
+
+import pytest
+
+from tap_yahooquery.tap import TapYahooQuery
+
+TICKERS = {
+    "AAPL": {"ticker": "AAPL", "segment": "stock_tickers"},
+    "VFIAX": {"ticker": "VFIAX", "segment": "mutual_fund_tickers"},
+}
+
+
+@pytest.fixture
+def tap(monkeypatch):
+    tap = TapYahooQuery(
+        config={
+            "tickers": {"select_tickers": ["AAPL"]},
+            "combine_quote_summary_modules": True,
+        },
+        parse_env_config=False,
+    )
+    tap.calls = []
+
+    def fetch(ticker, method_name, is_callable=True, endpoint=None, **kwargs):
+        tap.calls.append((ticker, method_name, kwargs.get("modules")))
+        if method_name == "get_modules":
+            return {
+                ticker: {module: {"module": module} for module in kwargs["modules"]}
+            }
+        return {ticker: {"module": method_name}}
+
+    for stream in tap.combined_quote_summary_streams:
+        stream._all_tickers = TICKERS
+        stream._partition_tickers = [
+            ticker
+            for ticker, record in TICKERS.items()
+            if stream._valid_segments is None
+            or record["segment"] in stream._valid_segments
+        ]
+        monkeypatch.setattr(stream, "_fetch_with_crumb_retry", fetch)
+    return tap
+
+
+def test_modules_fetched_once_for_streams_sharing_ticker(tap):
+    calendar = tap.streams["calendar_events"]
+    earnings = tap.streams["earnings"]
+    trend = tap.streams["earnings_trend"]
+
+    assert calendar._fetch_data("AAPL", "calendar_events", is_callable=False) == {
+        "AAPL": {"module": "calendarEvents"}
+    }
+    assert earnings._fetch_data("AAPL", "earnings", is_callable=False) == {
+        "AAPL": {"module": "earnings"}
+    }
+    assert trend._fetch_data("AAPL", "earnings_trend", is_callable=False) == {
+        "AAPL": {"module": "earningsTrend"}
+    }
+    assert tap.streams["sec_filings"]._fetch_data(
+        "AAPL", "get_modules", endpoint="sec_filings", modules="secFilings"
+    ) == {"AAPL": {"module": "secFilings"}}
+
+    assert tap.calls == [
+        (
+            "AAPL",
+            "get_modules",
+            ["calendarEvents", "earnings", "earningsTrend", "secFilings"],
+        )
+    ]
+    assert tap._combined_modules == {}
+
+
+def test_single_remaining_module_is_fetched_alone(tap):
+    calendar = tap.streams["calendar_events"]
+    tap.streams["sec_filings"]._finish_partition("VFIAX")
+
+    # earnings and earnings_trend skip mutual funds and sec_filings is done,
+    # so nothing is left to share
+    data = calendar._fetch_data("VFIAX", "calendar_events", is_callable=False)
+
+    assert data == {"VFIAX": {"module": "calendar_events"}}
+    assert tap.calls == [("VFIAX", "calendar_events", None)]
+    assert tap._combined_modules == {}
+
+
+def test_finished_stream_modules_are_dropped_and_not_fetched_again(tap):
+    calendar = tap.streams["calendar_events"]
+    earnings = tap.streams["earnings"]
+
+    calendar._fetch_data("AAPL", "calendar_events", is_callable=False)
+    earnings._finish_partition("AAPL")
+
+    assert tap._combined_modules == {
+        "AAPL": {
+            "earningsTrend": {"AAPL": {"module": "earningsTrend"}},
+            "secFilings": {"AAPL": {"module": "secFilings"}},
+        }
+    }
+
+    tap.streams["earnings_trend"]._finish_partition("AAPL")
+    tap.streams["sec_filings"]._finish_partition("VFIAX")
+    assert tap._combined_modules == {}
+
+    # every other combined stream is done, so VFIAX is fetched alone
+    calendar._fetch_data("VFIAX", "calendar_events", is_callable=False)
+    assert tap.calls[-1] == ("VFIAX", "calendar_events", None)
@@ -0,0 +1,160 @@
+"""Tests for the DataFrame helpers shared by the streams."""
+
+import datetime
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tap_yahooquery.helpers import (
+    clean_empty_value,
+    fix_empty_values,
+    format_dates_ymd,
+    iter_records,
+    to_arrow_dtypes,
+)
+
+
+def test_format_dates_ymd_matches_strftime():
+    dates = pd.Series(pd.to_datetime(["2024-01-31 23:59:59", "1999-12-01 00:00:00"]))
+
+    assert format_dates_ymd(dates).tolist() == dates.dt.strftime("%Y-%m-%d").tolist()
+
+
+def test_format_dates_ymd_missing_and_tz_aware():
+    dates = pd.Series(pd.to_datetime(["2024-03-01 23:30", None])).dt.tz_localize(
+        "America/New_York"
+    )
+
+    # keeps the wall-clock date rather than converting to UTC
+    assert format_dates_ymd(dates).tolist() == ["2024-03-01", None]
+
+
+def test_format_dates_ymd_non_nanosecond_unit():
+    dates = pd.Series(np.array(["2024-06-30", "NaT"], dtype="datetime64[s]"))
+
+    assert format_dates_ymd(dates).tolist() == ["2024-06-30", None]
+
+
+def test_iter_records_matches_to_dict_records():
+    df = pd.DataFrame(
+        {
+            "ticker": ["AAPL", "MSFT"],
+            "value": [1.5, 2.0],
+            "nested": [{"a": 1}, [1, 2]],
+        }
+    )
+
+    assert list(iter_records(df)) == df.to_dict(orient="records")
+
+
+def test_iter_records_empty_frame():
+    assert list(iter_records(pd.DataFrame(columns=["ticker"]))) == []
+
+
+def test_iter_records_converts_values_to_python_objects():
+    df = pd.DataFrame(
+        {
+            "ticker": ["AAPL", "MSFT"],
+            "count": pd.array([1, None], dtype="Int64"),
+            "when": pd.to_datetime(["2024-01-02", None]),
+            "nested": [{"a": 1}, [1, 2]],
+        }
+    )
+    records = list(iter_records(df))
+
+    assert records == [
+        {
+            "ticker": "AAPL",
+            "count": 1,
+            "when": datetime.datetime(2024, 1, 2),
+            "nested": {"a": 1},
+        },
+        {"ticker": "MSFT", "count": None, "when": None, "nested": [1, 2]},
+    ]
+    assert type(records[0]["when"]) is datetime.datetime
+    assert type(records[0]["count"]) is int
+
+
+def test_iter_records_interns_keys():
+    column = "".join(["as_of", "_date"])  # built at runtime, so not already interned
+    records = list(iter_records(pd.DataFrame({column: ["2024-09-30", "2024-06-30"]})))
+
+    assert records[0].keys() == {"as_of_date"}
+    key = next(iter(records[0]))
+    assert key is sys.intern("as_of_date")
+    assert next(iter(records[1])) is key
+
+
+def empty_values_frame():
+    return pd.DataFrame(
+        {
+            "ints": [1, 2, 3],
+            "floats": [1.5, 2.5, 3.5],
+            "gaps": [1.5, np.nan, np.inf],
+            "dates": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]),
+            "missing_dates": pd.to_datetime(["2024-01-01", None, "2024-03-01"]),
+            "strings": ["AAPL", "nan", "Infinity"],
+            "nested": [{"a": "None", "b": 1}, [np.nan, "x"], None],
+        }
+    )
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+def test_fix_empty_values_output(inplace):
+    df = empty_values_frame()
+    original = empty_values_frame()
+
+    out = fix_empty_values(df, inplace=inplace)
+
+    # as produced before clean numeric columns skipped the replace
+    expected = pd.DataFrame(
+        {
+            "ints": original["ints"],
+            "floats": original["floats"],
+            "gaps": pd.Series([1.5, None, None], dtype=object),
+            "dates": original["dates"],
+            "missing_dates": pd.Series(
+                [pd.Timestamp("2024-01-01"), None, pd.Timestamp("2024-03-01")],
+                dtype=object,
+            ),
+            "strings": pd.Series(["AAPL", None, None], dtype=original["strings"].dtype),
+            "nested": [{"a": None, "b": 1}, [None, "x"], None],
+        }
+    )
+    pd.testing.assert_frame_equal(out, expected)
+    if inplace:
+        assert out is df
+    else:
+        pd.testing.assert_frame_equal(df, original)
+
+
+def test_to_arrow_dtypes_emits_the_same_records():
+    pytest.importorskip("pyarrow")
+    df = fix_empty_values(
+        pd.DataFrame(
+            {
+                "ticker": ["AAPL", "MSFT", "NVDA"],
+                "form": ["10-K", None, "nan"],
+                "count": [1, 2, 3],
+                "price": [1.5, np.nan, 3.25],
+                "flag": [True, False, True],
+                "filed": pd.to_datetime(["2024-01-01", "2024-02-01", None]),
+                "exhibits": [[{"type": "EX-21"}], [], None],
+            }
+        )
+    )
+    # pandas 3 str columns turn the None fix_empty_values writes back into NaN,
+    # which the pyarrow string column emits as None
+    expected = [
+        {key: clean_empty_value(value) for key, value in record.items()}
+        for record in iter_records(df.copy())
+    ]
+
+    out = to_arrow_dtypes(df)
+
+    assert isinstance(out["ticker"].dtype, pd.ArrowDtype)
+    assert isinstance(out["count"].dtype, pd.ArrowDtype)
+    assert out["exhibits"].dtype == object
+    assert list(iter_records(out)) == expected
@@ -0,0 +1,156 @@
+"""Tests for the prefetch window and the per-sync state it holds."""
+
+import datetime
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+from tap_yahooquery.streams import normalize_frame
+from tap_yahooquery.tap import TapYahooQuery
+
+TICKERS = ["AAPL", "MSFT", "NVDA"]
+
+
+def make_tap(**config):
+    return TapYahooQuery(
+        config={"tickers": {"select_tickers": ["AAPL"]}, **config},
+        parse_env_config=False,
+    )
+
+
+def dividend_frame(ticker: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"dividends": [0.24, 0.25]},
+        index=pd.MultiIndex.from_tuples(
+            [
+                (ticker, datetime.date(2024, 5, 10)),
+                (ticker, datetime.date(2024, 8, 12)),
+            ],
+            names=["symbol", "date"],
+        ),
+    )
+
+
+def test_process_pool_normalize_matches_inline_and_closes_after_last_partition():
+    stream = make_tap(normalize_in_processes=True, fetch_concurrency=2).streams[
+        "dividend_history"
+    ]
+    stream._partition_tickers = TICKERS
+
+    pools = []
+
+    def fetch(ticker):
+        pools.append(stream._process_pool)
+        return stream._normalize("dividend_history", dividend_frame(ticker))
+
+    for ticker in TICKERS:
+        out = stream._prefetched(ticker, fetch)
+        pd.testing.assert_frame_equal(
+            out, normalize_frame("dividend_history", dividend_frame(ticker))
+        )
+
+    assert all(isinstance(pool, ProcessPoolExecutor) for pool in pools)
+    assert stream._process_pool is None
+    assert stream._process_pool_slots is None
+
+
+def test_normalize_runs_inline_without_process_pool():
+    stream = make_tap(fetch_concurrency=2).streams["dividend_history"]
+    stream._partition_tickers = TICKERS
+
+    for ticker in TICKERS:
+        stream._prefetched(
+            ticker,
+            lambda ticker: stream._normalize(
+                "dividend_history", dividend_frame(ticker)
+            ),
+        )
+        assert stream._process_pool is None
+
+
+def test_leftover_cross_stream_fetches_are_cancelled_after_last_partition():
+    tap = make_tap(fetch_concurrency=2)
+    stream = tap.streams["dividend_history"]
+    stream._partition_tickers = TICKERS
+    leftover, other = Future(), Future()
+    tap._cross_stream_futures[(stream.name, "ZZZ")] = leftover
+    tap._cross_stream_futures[("income_stmt", "ZZZ")] = other
+
+    for ticker in TICKERS:
+        stream._prefetched(ticker, lambda ticker: ticker)
+
+    assert leftover.cancelled()
+    assert not other.cancelled()
+    assert list(tap._cross_stream_futures) == [("income_stmt", "ZZZ")]
+
+
+def test_prefetched_results_follow_partition_order():
+    stream = make_tap(fetch_concurrency=3).streams["dividend_history"]
+    stream._partition_tickers = TICKERS
+    started = []
+
+    def fetch(ticker):
+        started.append(ticker)
+        # later tickers finish first
+        time.sleep(0.01 * (len(TICKERS) - TICKERS.index(ticker)))
+        return ticker.lower()
+
+    results = [stream._prefetched(ticker, fetch) for ticker in TICKERS]
+
+    assert results == ["aapl", "msft", "nvda"]
+    assert sorted(started) == sorted(TICKERS)
+    assert stream._prefetch_futures == {}
+    assert stream._prefetch_index is None
+
+
+def test_prefetched_error_is_raised_for_its_own_ticker_only():
+    stream = make_tap(fetch_concurrency=3).streams["dividend_history"]
+    stream._partition_tickers = TICKERS
+
+    def fetch(ticker):
+        if ticker == "MSFT":
+            raise ValueError("MSFT failed")
+        return ticker
+
+    assert stream._prefetched("AAPL", fetch) == "AAPL"
+    with pytest.raises(ValueError, match="MSFT failed"):
+        stream._prefetched("MSFT", fetch)
+    assert stream._prefetched("NVDA", fetch) == "NVDA"
+    assert stream._prefetch_futures == {}
+
+
+def test_next_stream_picks_up_fetches_started_across_streams(monkeypatch):
+    tap = make_tap(fetch_concurrency=2, prefetch_across_streams=True)
+    stream = tap.streams["company_officers"]
+    stream._partition_tickers = TICKERS
+    stream._all_tickers = {
+        ticker: {"ticker": ticker, "segment": "stock_tickers"} for ticker in TICKERS
+    }
+    next_stream = stream._next_prefetch_stream
+    next_stream._partition_tickers = TICKERS
+    calls = []
+    lock = threading.Lock()
+
+    def fetch_next(ticker):
+        with lock:
+            calls.append(ticker)
+        return f"{next_stream.name}:{ticker}"
+
+    monkeypatch.setattr(next_stream, "_fetch_for_ticker", fetch_next)
+
+    for ticker in TICKERS:
+        stream._prefetched(ticker, lambda ticker: ticker)
+    # the last window started the next stream's first tickers
+    assert set(tap._cross_stream_futures) == {
+        (next_stream.name, "AAPL"),
+        (next_stream.name, "MSFT"),
+    }
+
+    results = [next_stream._prefetched(ticker, fetch_next) for ticker in TICKERS]
+
+    assert results == [f"{next_stream.name}:{ticker}" for ticker in TICKERS]
+    assert sorted(calls) == sorted(TICKERS)
+    assert tap._cross_stream_futures == {}
@@ -0,0 +1,386 @@
+"""Tests for the stream-level frame builders and normalizers."""
+
+import datetime
+from uuid import NAMESPACE_DNS, uuid5
+
+import pandas as pd
+import pytest
+
+from tap_yahooquery import schema
+from tap_yahooquery.helpers import fix_empty_values
+
+from tap_yahooquery.streams import (
+    _DATE_CLEANUP,
+    _EARNINGS_TREND_FIELDS,
+    _NEEDS_SECONDS,
+    AllFinancialDataStream,
+    IncomeStmtStream,
+    normalize_frame,
+    trend_columns_builder,
+)
+from tap_yahooquery.tap import TapYahooQuery
+
+TRENDS = [
+    (
+        "AAPL",
+        {
+            "period": "0q",
+            "endDate": "2024-09-30",
+            "growth": 0.1,
+            "earningsEstimate": {"avg": 1.6, "low": 1.5, "earningsCurrency": "USD"},
+            "revenueEstimate": {"avg": 94e9, "numberOfAnalysts": 25},
+            "epsTrend": {"current": 1.6, "7daysAgo": 1.59},
+            "epsRevisions": {"upLast7days": 2, "downLast30days": 1},
+        },
+    ),
+    # sections missing, null or empty, as Yahoo returns for thinly covered tickers
+    ("MSFT", {"period": "+1y", "earningsEstimate": None, "epsTrend": {}}),
+    ("MSFT", {}),
+]
+
+
+def plain_trend_columns(fields, trends):
+    """Reference implementation: walk the field spec for every trend."""
+    columns = {column: [] for column, _ in fields}
+    for symbol, trend in trends:
+        for column, path in fields:
+            if path == ("symbol",):
+                value = symbol
+            elif len(path) == 1:
+                value = trend.get(path[0])
+            else:
+                value = (trend.get(path[0]) or {}).get(path[1])
+            columns[column].append(value)
+    return columns
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        tuple(_EARNINGS_TREND_FIELDS.items()),
+        tuple(
+            (column, path)
+            for column, path in _EARNINGS_TREND_FIELDS.items()
+            if column in ("ticker", "growth", "eps_trend_7days_ago", "revenue_avg")
+        ),
+    ],
+)
+def test_trend_columns_builder_matches_field_spec(fields):
+    build = trend_columns_builder(fields)
+
+    assert build(TRENDS) == plain_trend_columns(fields, TRENDS)
+    assert list(build(TRENDS)) == [column for column, _ in fields]
+
+
+def test_trend_columns_builder_without_trends():
+    fields = tuple(_EARNINGS_TREND_FIELDS.items())
+
+    assert trend_columns_builder(fields)([]) == {column: [] for column, _ in fields}
+
+
+def test_normalize_sec_filings_promotes_ticker():
+    df = pd.DataFrame(
+        {"date": ["2024-11-01"], "edgarUrl": ["https://example.com"], "maxAge": [1]},
+        index=pd.MultiIndex.from_tuples([("AAPL", 0)], names=["symbol", "row"]),
+    )
+    out = normalize_frame("sec_filings", df)
+
+    assert list(out.columns) == ["ticker", "date", "edgar_url", "max_age"]
+    assert out["ticker"].tolist() == ["AAPL"]
+
+
+def test_normalize_dividend_history_promotes_symbol_level():
+    df = pd.DataFrame(
+        {"dividends": [0.24, 0.25]},
+        index=pd.MultiIndex.from_tuples(
+            [
+                ("AAPL", datetime.date(2024, 5, 10)),
+                ("AAPL", datetime.date(2024, 8, 12)),
+            ],
+            names=["symbol", "date"],
+        ),
+    )
+    out = normalize_frame("dividend_history", df)
+
+    assert list(out.columns) == ["ticker", "date", "dividends"]
+    assert out["ticker"].tolist() == ["AAPL", "AAPL"]
+
+
+def test_normalize_income_statement_renames_and_formats_dates():
+    df = pd.DataFrame(
+        {
+            "asOfDate": pd.to_datetime(["2024-09-30", None]),
+            "periodType": ["12M", "TTM"],
+            "EBITDA": [1.0, float("nan")],
+            "DilutedEPS": [6.1, 6.2],
+        },
+        index=pd.Index(["AAPL", "AAPL"], name="symbol"),
+    )
+    out = normalize_frame("income_statement", df)
+
+    assert list(out.columns) == [
+        "ticker",
+        "as_of_date",
+        "period_type",
+        "ebitda",
+        "diluted_eps",
+    ]
+    assert out["as_of_date"].tolist()[0] == "2024-09-30"
+    assert pd.isna(out["as_of_date"].tolist()[1])
+    assert out["ebitda"].tolist() == [1.0, None]
+
+
+def test_normalize_corporate_events_keeps_missing_significance():
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-25", "2024-02-01"]),
+            "significance": [1.0, float("nan")],
+            "headline": ["Earnings", "Dividend"],
+        },
+        index=pd.Index(["AAPL", "AAPL"], name="symbol"),
+    )
+    out = normalize_frame("corporate_events", df)
+
+    assert list(out.columns) == ["ticker", "date", "significance", "headline"]
+    assert out["date"].tolist() == ["2024-01-25", "2024-02-01"]
+    assert out["significance"].tolist()[0] == 1
+    assert pd.isna(out["significance"].tolist()[1])
+
+
+def officers_frame():
+    return pd.DataFrame(
+        {
+            "name": ["Tim Cook", "Luca Maestri"],
+            "title": ["CEO", "CFO"],
+            "age": [63, float("nan")],
+            "yearBorn": [1961, 1963],
+            "totalPay": [16_000_000, None],
+        },
+        index=pd.MultiIndex.from_tuples(
+            [("AAPL", 0), ("AAPL", 1)], names=["symbol", "row"]
+        ),
+    )
+
+
+def test_normalize_company_officers_matches_row_wise_surrogate_keys():
+    cols = ["ticker", "officers", "name", "age", "title", "year_born", "total_pay"]
+    expected = officers_frame().reset_index(level=0)
+    expected.columns = ["ticker", "name", "title", "age", "year_born", "total_pay"]
+    # the former per-row construction: df.apply(make_uuid, axis=1)
+    expected_keys = expected.apply(
+        lambda row: uuid5(
+            NAMESPACE_DNS,
+            "".join(f"{str(row[col])}|{col}|" for col in cols if col in row),
+        ),
+        axis=1,
+    ).tolist()
+
+    out = normalize_frame("company_officers", officers_frame())
+
+    assert list(out.columns) == [
+        "ticker",
+        "name",
+        "title",
+        "age",
+        "year_born",
+        "total_pay",
+        "surrogate_key",
+    ]
+    assert out["surrogate_key"].tolist() == expected_keys
+
+
+def test_normalize_company_officers_blake2b_keys():
+    out = normalize_frame("company_officers", officers_frame(), key_hash="blake2b")
+    again = normalize_frame("company_officers", officers_frame(), key_hash="blake2b")
+    default = normalize_frame("company_officers", officers_frame())
+
+    assert out["surrogate_key"].nunique() == 2
+    assert out["surrogate_key"].tolist() == again["surrogate_key"].tolist()
+    assert out["surrogate_key"].tolist() != default["surrogate_key"].tolist()
+
+
+def plain_clean_earnings_date(date):
+    """Reference implementation: the replace/rstrip/count chain the regexes replaced."""
+    clean_date = date.replace("S", "").rstrip(":")
+    if clean_date.count(":") == 2 and clean_date.endswith(":"):
+        clean_date = clean_date + "00"
+    elif clean_date.count(":") == 1:
+        clean_date = clean_date + ":00"
+    return clean_date
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        "2024-01-25 05:59:S",
+        "2024-01-25 05:59:SS",
+        "2024-01-25 05:59:30",
+        "2024-01-25 05:S",
+        "2024-01-25 05::",
+        "2024-01-25 05",
+        "2024-01-25",
+        "2024-01-25T05:59:00",
+        "Sep 25 2024 05:59:S",
+        "S",
+        "",
+    ],
+)
+def test_date_cleanup_regexes_match_string_chain(date):
+    cleaned = _DATE_CLEANUP.sub("", date)
+    if _NEEDS_SECONDS.match(cleaned):
+        cleaned += ":00"
+
+    assert cleaned == plain_clean_earnings_date(date)
+
+
+def plain_parse_earnings_dates(earnings_dates):
+    """Reference implementation: parse each earnings date on its own, skipping failures."""
+    parsed = []
+    for date in earnings_dates:
+        try:
+            if isinstance(date, str):
+                date = plain_clean_earnings_date(date)
+            parsed.append(pd.to_datetime(date))
+        except (ValueError, TypeError):
+            continue
+    return parsed
+
+
+def test_parse_earnings_dates_matches_per_date_parsing():
+    stream = TapYahooQuery(
+        config={"tickers": {"select_tickers": ["AAPL"]}}, parse_env_config=False
+    ).streams["calendar_events"]
+    earnings_dates = [
+        "2024-01-25 05:59:S",
+        "2024-04-25 16:S",
+        "2024-07-25",
+        1706000000,
+        None,
+        "not a date",
+        pd.Timestamp("2024-10-31 20:30"),
+    ]
+
+    parsed = stream._parse_earnings_dates("AAPL", earnings_dates)
+
+    pd.testing.assert_series_equal(
+        parsed,
+        pd.Series(plain_parse_earnings_dates(earnings_dates), dtype=parsed.dtype),
+    )
+
+
+EARNINGS = {
+    "AAPL": {
+        "maxAge": 86400,
+        "financialCurrency": "USD",
+        "earningsChart": {
+            "quarterly": [
+                {"date": "2Q2024", "actual": 1.4, "estimate": 1.35},
+                {"date": "3Q2024", "actual": 1.64, "estimate": None},
+            ],
+            "currentQuarterEstimate": 2.35,
+            "currentQuarterEstimateDate": "4Q",
+            "currentQuarterEstimateYear": 2024,
+            "earningsDate": ["2025-01-30 05:59:S", "2025-02-03 06:00:S"],
+            "isEarningsDateEstimate": True,
+        },
+        "financialsChart": {
+            "yearly": [{"date": 2023, "revenue": 383285e6, "earnings": 96995e6}],
+            "quarterly": [{"date": "3Q2024", "revenue": 94930e6, "earnings": 14736e6}],
+        },
+    },
+    "MSFT": {
+        "maxAge": 86400,
+        "earningsChart": {
+            "quarterly": [{"date": "1Q2025", "actual": 3.3, "estimate": 3.1}]
+        },
+    },
+    "EMPTY": {"maxAge": 1, "earningsChart": {}, "financialsChart": {}},
+}
+
+
+def plain_earnings_records(ticker, data):
+    """Reference implementation: the row-by-row earnings records, cleaned as before."""
+    chart = data.get("earningsChart", {})
+    financials = data.get("financialsChart", {})
+
+    def row(date, row_type, **values):
+        return {
+            "ticker": ticker,
+            "date": date,
+            "type": row_type,
+            "actual": None,
+            "estimate": None,
+            "currency": data.get("financialCurrency"),
+            "max_age": data.get("maxAge"),
+            "current_quarter_estimate": None,
+            "current_quarter_estimate_date": None,
+            "current_quarter_estimate_year": None,
+            "earnings_date": None,
+            "is_earnings_date_estimate": None,
+            "revenue": None,
+            "earnings": None,
+            **values,
+        }
+
+    rows = [
+        row(q.get("date"), "eps", actual=q.get("actual"), estimate=q.get("estimate"))
+        for q in chart.get("quarterly", [])
+    ]
+    for period in ("quarterly", "yearly"):
+        rows += [
+            row(
+                str(f.get("date")),
+                period,
+                revenue=f.get("revenue"),
+                earnings=f.get("earnings"),
+            )
+            for f in financials.get(period, [])
+        ]
+    if "currentQuarterEstimate" in chart:
+        rows.append(
+            row(
+                chart.get("currentQuarterEstimateDate"),
+                "current_quarter_estimate",
+                actual=chart.get("currentQuarterEstimate"),
+                current_quarter_estimate=chart.get("currentQuarterEstimate"),
+                current_quarter_estimate_date=chart.get("currentQuarterEstimateDate"),
+                current_quarter_estimate_year=chart.get("currentQuarterEstimateYear"),
+            )
+        )
+    rows += [
+        row(
+            date,
+            "earnings_date",
+            earnings_date=date,
+            is_earnings_date_estimate=chart.get("isEarningsDateEstimate"),
+        )
+        for date in chart.get("earningsDate", [])
+    ]
+    return fix_empty_values(pd.DataFrame.from_records(rows)).to_dict("records")
+
+
+@pytest.mark.parametrize("ticker", list(EARNINGS))
+def test_earnings_records_match_row_wise_build(ticker, monkeypatch):
+    stream = TapYahooQuery(
+        config={"tickers": {"select_tickers": ["AAPL"]}}, parse_env_config=False
+    ).streams["earnings"]
+    monkeypatch.setattr(
+        stream,
+        "_fetch_data",
+        lambda ticker, *args, **kwargs: {ticker: EARNINGS[ticker]},
+    )
+
+    records = list(stream.get_records({"ticker": ticker}))
+    expected = plain_earnings_records(ticker, EARNINGS[ticker])
+
+    assert [list(record) for record in records] == [list(r) for r in expected]
+    pd.testing.assert_frame_equal(pd.DataFrame(records), pd.DataFrame(expected))
+
+
+def test_schema_aliases_share_the_stream_schema():
+    assert schema.INCOME_STMT_SCHEMA is IncomeStmtStream.schema
+    assert schema.ALL_FINANCIAL_DATA_SCHEMA is AllFinancialDataStream.schema
+    assert schema.INCOME_STMT_SCHEMA == schema.income_stmt_schema()
+    assert {"ticker", "as_of_date"} <= set(schema.INCOME_STMT_SCHEMA["properties"])
+    with pytest.raises(AttributeError):
+        schema.MISSING_SCHEMA